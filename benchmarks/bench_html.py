@@ -0,0 +1,142 @@
+"""Benchmarks for ``easytxt.html``.
+
+Run with ``python -m benchmarks.bench_html`` from the repository root.
+"""
+
+import random
+import timeit
+
+from pyquery import PyQuery
+
+from easytxt import css, html
+
+WORDS = [
+    "Color",
+    "black",
+    "cotton",
+    "Made",
+    "in",
+    "Italy",
+    "size",
+    "10",
+    "the",
+    "with",
+    "soft",
+    "and",
+    "pockets",
+]
+
+
+def make_product_page(size: int, seed: int = 0) -> str:
+    """Product page like html of roughly ``size`` characters, with deeply
+    nested blocks, inline tags, breaks, lists and spec tables."""
+
+    rnd = random.Random(seed)
+
+    def words(count: int) -> str:
+        return " ".join(rnd.choice(WORDS) for _ in range(count))
+
+    def block() -> str:
+        choice = rnd.random()
+
+        if choice < 0.4:
+            return "<p>{}. <b>{}</b> {}<br>{}.</p>".format(
+                words(8), words(2), words(6), words(5)
+            )
+        elif choice < 0.6:
+            items = "".join(
+                "<li><span>{}</span></li>".format(words(4)) for _ in range(5)
+            )
+            return "<ul>{}</ul>".format(items)
+        elif choice < 0.7:
+            rows = "".join(
+                "<tr><td>{}</td><td>{}</td></tr>".format(words(1), words(2))
+                for _ in range(4)
+            )
+            return "<table>{}</table>".format(rows)
+        else:
+            return "<div class='card'><div><div>{}</div></div></div>".format(
+                "<!-- item -->\n  <span>{}.</span>\n".format(words(10))
+            )
+
+    sections = []
+    length = 0
+
+    while length < size:
+        section = "<section><div><div>{}</div></div></section>".format(
+            "".join(block() for _ in range(10))
+        )
+        sections.append(section)
+        length += len(section)
+
+    return "<html><body><div id='page'>{}</div></body></html>".format("".join(sections))
+
+
+def bench_to_sentences() -> None:
+    print("html.to_sentences")
+
+    for size in (30_000, 300_000):
+        page = make_product_page(size)
+        pq = PyQuery(page)
+
+        seconds = min(timeit.repeat(lambda: html.to_sentences(pq), number=1, repeat=3))
+        sentence_count = len(html.to_sentences(pq))
+
+        print(
+            "  {:>8,} chars: {:>8.4f} s ({:,} sentences)".format(
+                len(page), seconds, sentence_count
+            )
+        )
+
+
+def bench_validate() -> None:
+    print("html.validate")
+
+    samples = {
+        "math text": "if a < b and x<y then z < w / 2 " * 600,
+        "plain text": "Some plain sentence without tags. " * 3000,
+        "product page": make_product_page(300_000),
+    }
+
+    for name, text in samples.items():
+        seconds = min(timeit.repeat(lambda: html.validate(text), number=10, repeat=3))
+
+        print(
+            "  {:>12} ({:>7,} chars): {:>8.6f} s".format(name, len(text), seconds / 10)
+        )
+
+
+def bench_selectors() -> None:
+    print("html.to_sentences with css_query and exclude_css (2k small pages)")
+
+    page = (
+        "<html><body><nav class='menu'><a>Home</a></nav><div id='description'>"
+        "<p>Soft cotton shirt. Made in Italy.</p><ul><li>Color: black</li>"
+        "<li>Size: 10</li></ul><div class='ads'>Buy now</div></div></body></html>"
+    )
+    pages = [PyQuery(page) for _ in range(2000)]
+
+    css.clear_selector_cache()
+
+    seconds = timeit.timeit(
+        lambda: [
+            html.to_sentences(
+                pq, css_query="#description", exclude_css=[".ads", "nav.menu"]
+            )
+            for pq in pages
+        ],
+        number=1,
+    )
+    cache_info = css.selector_cache_info()
+
+    print(
+        "  {:>8.4f} s ({:,} hits, {:,} misses)".format(
+            seconds, cache_info.hits, cache_info.misses
+        )
+    )
+
+
+if __name__ == "__main__":
+    bench_to_sentences()
+    bench_validate()
+    bench_selectors()
@@ -0,0 +1,116 @@
+"""Benchmarks for ``easytxt.parsers``.
+
+Run with ``python -m benchmarks.bench_parsers`` from the repository root.
+"""
+
+import random
+import timeit
+
+from easytxt import parsers
+from easytxt.parsers import StringParser, parse_string, parse_strings
+
+OPTIONS = [
+    {},
+    {"replace_keys": [("black", "dark")], "split_key": ("-", 0), "add_stop": True},
+    {"lowercase": True, "remove_keys": [":"], "take": 20},
+]
+
+
+def make_values(count: int, distinct: int, seed: int = 0):
+    """Scraped column like values, ``distinct`` of them repeated."""
+
+    rnd = random.Random(seed)
+
+    labels = [
+        "Color: Black - size {}".format(i) if i % 20 else "Café &amp; bar {}".format(i)
+        for i in range(distinct)
+    ]
+
+    return [rnd.choice(labels) for _ in range(count)]
+
+
+def bench_string_parser() -> None:
+    print("StringParser vs parse_string (100k values)")
+
+    values = make_values(100_000, 10_000)
+
+    for options in OPTIONS:
+        string_parser = StringParser(**options)
+
+        seconds = min(
+            timeit.repeat(
+                lambda: [parse_string(value, **options) for value in values],
+                number=1,
+                repeat=3,
+            )
+        )
+        sp_seconds = min(
+            timeit.repeat(
+                lambda: [string_parser(value) for value in values], number=1, repeat=3
+            )
+        )
+
+        print(
+            "  {:>50}: {:>8.4f} s -> {:>8.4f} s".format(
+                str(sorted(options))[:50], seconds, sp_seconds
+            )
+        )
+
+
+def bench_parse_strings() -> None:
+    print("parse_strings vs parse_string per value (100k values, 10k distinct)")
+
+    values = make_values(100_000, 10_000)
+
+    for options in OPTIONS:
+        seconds = min(
+            timeit.repeat(
+                lambda: [parse_string(value, **options) for value in values],
+                number=1,
+                repeat=3,
+            )
+        )
+        many_seconds = min(
+            timeit.repeat(lambda: parse_strings(values, **options), number=1, repeat=3)
+        )
+
+        print(
+            "  {:>50}: {:>8.4f} s -> {:>8.4f} s".format(
+                str(sorted(options))[:50], seconds, many_seconds
+            )
+        )
+
+
+def bench_parse_string_cache() -> None:
+    print("parse_string cache (100k values, 10k distinct)")
+
+    values = make_values(100_000, 10_000)
+    options = OPTIONS[1]
+    string_parser = StringParser(**options)
+
+    for name, function in (
+        ("parse_string", lambda value: parse_string(value, **options)),
+        ("StringParser", string_parser),
+    ):
+        seconds = timeit.timeit(lambda: [function(value) for value in values], number=1)
+
+        parsers.enable_parse_string_cache()
+
+        cached_seconds = timeit.timeit(
+            lambda: [function(value) for value in values], number=1
+        )
+        cache_info = parsers.parse_string_cache_info()
+
+        parsers.disable_parse_string_cache()
+
+        print(
+            "  {:>16}: {:>8.4f} s -> {:>8.4f} s ({:,} hits, {:,} misses)".format(
+                name, seconds, cached_seconds, cache_info.hits, cache_info.misses
+            )
+        )
+
+
+if __name__ == "__main__":
+    bench_string_parser()
+    bench_parse_strings()
+    bench_parse_string_cache()
@@ -0,0 +1,188 @@
+"""Benchmarks for ``easytxt.sentences``.
+
+Run with ``python -m benchmarks.bench_sentences`` from the repository root.
+"""
+
+import random
+import time
+import timeit
+import tracemalloc
+
+from pyquery import PyQuery
+
+from easytxt import html, sentences
+from easytxt.parsers.text import TextParser
+
+SPEC_WORDS = [
+    "No.",
+    "Incl.",
+    "etc.",
+    "Fig.",
+    "Approx.",
+    "Dr.",
+    "weight",
+    "battery",
+    "cable",
+    "adapter",
+    "12V",
+    "black",
+    "aluminium",
+]
+
+
+def make_spec_text(size: int, seed: int = 0) -> str:
+    """Abbreviation heavy text of roughly ``size`` characters."""
+
+    rnd = random.Random(seed)
+
+    words = []
+    length = 0
+
+    while length < size:
+        word = rnd.choice(SPEC_WORDS)
+
+        if rnd.random() < 0.005:
+            word += " Done."
+
+        words.append(word)
+        length += len(word) + 1
+
+    return " ".join(words)
+
+
+def bench_from_text() -> None:
+    print("sentences.from_text (abbreviation heavy spec text)")
+
+    for size in (1_000, 10_000, 100_000, 1_000_000, 10_000_000):
+        text = make_spec_text(size)
+        number = max(1, 1_000_000 // size)
+
+        seconds = timeit.timeit(
+            lambda: sentences.from_text(text, split_inline_breaks=False),
+            number=number,
+        )
+        seconds /= number
+
+        print(
+            "  {:>10,} chars: {:>9.4f} s  {:>7.1f} ns/char".format(
+                len(text), seconds, seconds * 1e9 / len(text)
+            )
+        )
+
+
+def bench_iter_from_text() -> None:
+    print("sentences.iter_from_text (streamed in 64 KB chunks)")
+
+    for size in (1_000_000, 10_000_000, 100_000_000):
+        started = time.perf_counter()
+        _consume(sentences.iter_from_text(_iter_spec_chunks(size)))
+        seconds = time.perf_counter() - started
+
+        # Measured in a separate run since tracing slows everything down
+        tracemalloc.start()
+        _consume(sentences.iter_from_text(_iter_spec_chunks(size)))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            "  {:>11,} chars: {:>9.4f} s  peak {:>6.2f} MB".format(
+                size, seconds, peak / 1e6
+            )
+        )
+
+
+def _iter_spec_chunks(size: int, chunk_size: int = 65536):
+    """Generate the text on the fly so that input isn't held in memory."""
+
+    for seed in range(size // chunk_size):
+        yield make_spec_text(chunk_size, seed) + " "
+
+
+def bench_fragments() -> None:
+    print("sentences.merge / split_inline_breaks_to_sentences (page fragments)")
+
+    for count in (10_000, 100_000, 1_000_000):
+        fragments = ["Color:", "Black - matte * glossy.", "Weight: 2 kg"] * (count // 3)
+
+        for name, function in (
+            ("merge", sentences.merge),
+            ("split_inline_breaks", sentences.split_inline_breaks_to_sentences),
+        ):
+            seconds = timeit.timeit(lambda: function(list(fragments)), number=1)
+
+            print(
+                "  {:>20} {:>10,} fragments: {:>8.4f} s".format(
+                    name, len(fragments), seconds
+                )
+            )
+
+
+def bench_from_texts() -> None:
+    print("sentences.from_texts vs one call per text (100 char blurbs)")
+
+    blurbs = [make_spec_text(100, seed)[:100] for seed in range(20_000)]
+
+    seconds = timeit.timeit(
+        lambda: [TextParser(blurb).sentences for blurb in blurbs], number=1
+    )
+    print("  {:>20}: {:>8.4f} s".format("TextParser", seconds))
+
+    seconds = timeit.timeit(
+        lambda: [sentences.from_text(blurb) for blurb in blurbs], number=1
+    )
+    print("  {:>20}: {:>8.4f} s".format("from_text", seconds))
+
+    seconds = timeit.timeit(lambda: sentences.from_texts(blurbs), number=1)
+    print("  {:>20}: {:>8.4f} s".format("from_texts", seconds))
+
+
+def bench_html_fragments() -> None:
+    print("TextParser html fragments: together vs one by one (800 list items)")
+
+    items = "".join(
+        "<li>Item {}: café “matte” &amp; glossy</li><li>Add to cart</li>".format(i)
+        for i in range(400)
+    )
+    pq = PyQuery("<ul>{}</ul>".format(items))
+    parser = TextParser(pq)
+
+    seconds = timeit.timeit(lambda: parser._html_data_to_raw_sentences(pq), number=5)
+    print("  {:>20}: {:>8.4f} s".format("together", seconds / 5))
+
+    def one_by_one():
+        raw_sentences = []
+
+        for fragment in html.to_sentences(pq):
+            raw_sentences += parser._text_to_raw_sentences(fragment)
+
+        return raw_sentences
+
+    seconds = timeit.timeit(one_by_one, number=5)
+    print("  {:>20}: {:>8.4f} s".format("one by one", seconds / 5))
+
+
+def bench_workers() -> None:
+    print("sentences.from_text (workers)")
+
+    text = make_spec_text(20 * 1024 * 1024)
+
+    for workers in (None, 2, 4, 8):
+        seconds = timeit.timeit(
+            lambda: sentences.from_text(text, workers=workers), number=1
+        )
+
+        print("  workers={!s:>4}: {:>8.4f} s".format(workers, seconds))
+
+
+def _consume(iterator) -> None:
+    for _ in iterator:
+        pass
+
+
+if __name__ == "__main__":
+    bench_from_text()
+    bench_iter_from_text()
+    bench_fragments()
+    bench_from_texts()
+    bench_html_fragments()
+    bench_workers()
@@ -0,0 +1,225 @@
+"""Benchmarks for ``easytxt.text``.
+
+Run with ``python -m benchmarks.bench_text`` from the repository root.
+"""
+
+import random
+import re
+import timeit
+
+import ftfy
+from number_parser import parse
+
+from easytxt import sentences
+from easytxt import text as utext
+
+
+def make_replace_keys(count: int, seed: int = 0):
+    """Replacement table of ``count`` distinct product words."""
+
+    rnd = random.Random(seed)
+
+    words = set()
+
+    while len(words) < count:
+        words.add("".join(rnd.choice("bcdfghjklmnpqrstvwxz") for _ in range(6)))
+
+    return [(word, word.upper()) for word in sorted(words)]
+
+
+def make_texts(count: int, replace_keys, seed: int = 0):
+    rnd = random.Random(seed)
+
+    texts = []
+
+    for _ in range(count):
+        words = ["Black", "aluminium", "case", "with", "12V", "adapter"] * 2
+        words.insert(rnd.randrange(len(words)), rnd.choice(replace_keys)[0])
+        texts.append(" ".join(words))
+
+    return texts
+
+
+def bench_replace_chars_by_keys() -> None:
+    print("text.replace_chars_by_keys (200 keys, 10k texts)")
+
+    replace_keys = make_replace_keys(200)
+    texts = make_texts(10_000, replace_keys)
+
+    def sequential():
+        for text in texts:
+            for replace_key, replace_value in replace_keys:
+                if re.search(replace_key, text, flags=re.IGNORECASE):
+                    text = re.sub(replace_key, replace_value, text, flags=re.IGNORECASE)
+
+    table = utext.ReplacementTable(replace_keys)
+
+    for name, function in (
+        ("key by key", sequential),
+        ("table", lambda: [table.replace(text) for text in texts]),
+    ):
+        seconds = timeit.timeit(function, number=1)
+        print("  {:>12}: {:>8.4f} s".format(name, seconds))
+
+    seconds = timeit.timeit(lambda: utext.ReplacementTable(replace_keys), number=1)
+    print("  {:>12}: {:>8.4f} s".format("compile", seconds))
+
+
+def bench_deny_contains() -> None:
+    print("sentences.deny_contains (5000 keys, 100 pages of 100 sentences)")
+
+    deny_keys = [key for key, _ in make_replace_keys(5000)]
+    pages = [make_texts(100, make_replace_keys(20, seed), seed) for seed in range(100)]
+
+    def key_by_key():
+        for page_sentences in pages[:1]:
+            for sentence in page_sentences:
+                any(re.search(key, sentence, re.IGNORECASE) for key in deny_keys)
+
+    keyword_set = utext.KeywordSet(deny_keys)
+
+    seconds = timeit.timeit(key_by_key, number=1) * len(pages)
+    print(
+        "  {:>12}: {:>8.4f} s (estimated from one page)".format("key by key", seconds)
+    )
+
+    seconds = timeit.timeit(
+        lambda: [sentences.deny_contains(page, keyword_set) for page in pages],
+        number=1,
+    )
+    print("  {:>12}: {:>8.4f} s".format("keyword set", seconds))
+
+    seconds = timeit.timeit(lambda: utext.KeywordSet(deny_keys), number=1)
+    print("  {:>12}: {:>8.4f} s".format("compile", seconds))
+
+
+def bench_remove_chars_by_keys() -> None:
+    print("text.remove_chars_by_keys (20 single char keys, 10k texts)")
+
+    remove_keys = ["®", "™", r"\*", r"\|", "#", "~", "©", "°", "%", "&"]
+    remove_keys += ["†", "‡", "§", "¶", "•", "·", "«", "»", "¤", "¦"]
+    texts = [
+        "Easybook® Pro™ | 15* notebook with 8GB RAM {}".format(i) for i in range(10_000)
+    ]
+
+    def key_by_key():
+        for text in texts:
+            for remove_key in remove_keys:
+                if re.search(remove_key, text, flags=re.IGNORECASE):
+                    text = re.sub(remove_key, "", text, flags=re.IGNORECASE)
+
+    for name, function in (
+        ("key by key", key_by_key),
+        (
+            "translate",
+            lambda: [utext.remove_chars_by_keys(t, remove_keys) for t in texts],
+        ),
+    ):
+        seconds = timeit.timeit(function, number=1)
+        print("  {:>12}: {:>8.4f} s".format(name, seconds))
+
+
+def bench_normalize() -> None:
+    print("text.fix_text (100k short fragments, 1k distinct)")
+
+    fragments = ["Black aluminium case {}".format(i % 500) for i in range(50_000)]
+    fragments += ["Caf\u00c3\u00a9 &amp; bar {}".format(i % 500) for i in range(50_000)]
+
+    seconds = timeit.timeit(
+        lambda: [ftfy.fix_text(fragment) for fragment in fragments], number=1
+    )
+    print("  {:>16}: {:>8.4f} s".format("ftfy.fix_text", seconds))
+
+    seconds = timeit.timeit(
+        lambda: [utext.fix_text(fragment) for fragment in fragments], number=1
+    )
+    print("  {:>16}: {:>8.4f} s".format("fix_text", seconds))
+
+    utext.enable_fix_text_cache()
+
+    seconds = timeit.timeit(
+        lambda: [utext.fix_text(fragment) for fragment in fragments], number=1
+    )
+    print("  {:>16}: {:>8.4f} s".format("fix_text cached", seconds))
+    print("  {}".format(utext.fix_text_cache_info()))
+
+    utext.disable_fix_text_cache()
+
+
+def bench_text_num() -> None:
+    print("text.to_numeric_from_text_num (10k sentences, 5% with number words)")
+
+    texts = ["Black aluminium case with {} cm strap.".format(i) for i in range(9_500)]
+    texts += ["Box of twenty {} items.".format(i) for i in range(500)]
+
+    seconds = timeit.timeit(lambda: [parse(t, language="en") for t in texts], number=1)
+    print("  {:>16}: {:>8.4f} s".format("parse", seconds))
+
+    seconds = timeit.timeit(lambda: utext.to_numeric_from_text_num(texts), number=1)
+    print("  {:>16}: {:>8.4f} s".format("from_text_num", seconds))
+
+
+def _re_split_by_key(text, split_key, split_index=0, case_sensitive=False):
+    ignore_case = 0 if case_sensitive else re.IGNORECASE
+    return re.split(split_key, text, ignore_case)[split_index]
+
+
+def _re_contains(text, keys, case_sensitive=False):
+    if isinstance(keys, str):
+        keys = [keys]
+
+    ignore_case = 0 if case_sensitive else re.IGNORECASE
+
+    for key in keys:
+        if re.search(key, text, ignore_case):
+            return True
+
+    return False
+
+
+def _re_replace_chars_by_key(text, replace_key, replace_value):
+    if re.search(replace_key, text, flags=re.IGNORECASE):
+        text = re.sub(replace_key, replace_value, text, flags=re.IGNORECASE)
+
+    return text
+
+
+def bench_literal_keys() -> None:
+    print("literal keys, previous re based functions vs fast paths (100k calls)")
+
+    text = "Black aluminium case with 12V adapter, weight: 2 kg"
+
+    cases = (
+        ("split_by_key", _re_split_by_key, utext.split_by_key, ("weight",)),
+        ("contains", _re_contains, utext.contains, ("Adapter",)),
+        ("contains (3 keys)", _re_contains, utext.contains, (["a4", "b5", "c6"],)),
+        (
+            "replace (miss)",
+            _re_replace_chars_by_key,
+            utext.replace_chars_by_key,
+            ("steel", "metal"),
+        ),
+        (
+            "replace (hit)",
+            _re_replace_chars_by_key,
+            utext.replace_chars_by_key,
+            ("case", "box"),
+        ),
+    )
+
+    for name, re_function, function, args in cases:
+        assert re_function(text, *args) == function(text, *args)
+
+        re_seconds = timeit.timeit(lambda: re_function(text, *args), number=100_000)
+        seconds = timeit.timeit(lambda: function(text, *args), number=100_000)
+
+        print("  {:>18}: {:>8.4f} s -> {:>8.4f} s".format(name, re_seconds, seconds))
+
+
+if __name__ == "__main__":
+    bench_replace_chars_by_keys()
+    bench_remove_chars_by_keys()
+    bench_deny_contains()
+    bench_literal_keys()
+    bench_normalize()
+    bench_text_num()
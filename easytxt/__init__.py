@@ -1,9 +1,11 @@
 __version__ = "0.1.2"
 
-from easytxt.parsers import parse_string
+from easytxt.parsers import StringParser, parse_string, parse_strings
 from easytxt.parsers.table import TableParser
 from easytxt.parsers.text import TextParser
 
 parse_string = parse_string
+parse_strings = parse_strings
+StringParser = StringParser
 parse_table = TableParser
 parse_text = TextParser
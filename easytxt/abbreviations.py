@@ -1,177 +1,258 @@
-en = [
-    "Mr",
-    "Mrs",
-    "No",
-    "pp",
-    "St",
-    "no",
-    "Sr",
-    "Jr",
-    "Bros",
-    "etc",
-    "vs",
-    "esp",
-    "Fig",
-    "fig",
-    "Jan",
-    "Feb",
-    "Mar",
-    "Apr",
-    "Jun",
-    "Jul",
-    "Aug",
-    "Sep",
-    "Sept",
-    "Oct",
-    "Okt",
-    "Nov",
-    "Excl",
-    "Incl",
-    "Dec",
-    "Ph.D",
-    "PhD",
-    "al",
-    "cf",
-    "Inc",
-    "Ms",
-    "Gen",
-    "Sen",
-    "Prof",
-    "Dr",
-    "Corp",
-    "Co",
-    "Adj",
-    "Adm",
-    "Adv",
-    "Asst",
-    "Bart",
-    "Bldg",
-    "Brig",
-    "Bros",
-    "Capt",
-    "Cmdr",
-    "Col",
-    "Comdr",
-    "Con",
-    "Corp",
-    "Cpl",
-    "DR",
-    "Dr",
-    "Drs",
-    "Ens",
-    "Gen",
-    "Gov",
-    "Hon",
-    "Hr",
-    "Hosp",
-    "Insp",
-    "Lt",
-    "MM",
-    "MR",
-    "MRS",
-    "MS",
-    "Maj",
-    "Messrs",
-    "Mlle",
-    "Mme",
-    "Mr",
-    "Mrs",
-    "Ms",
-    "Msgr",
-    "Op",
-    "Ord",
-    "Pfc",
-    "Ph",
-    "Prof",
-    "Pvt",
-    "Rep",
-    "Reps",
-    "Res",
-    "Rev",
-    "Rt",
-    "Sen",
-    "Sens",
-    "Sfc",
-    "Sgt",
-    "Sr",
-    "St",
-    "Supt",
-    "Surg",
-    "vs",
-    "i.e",
-    "rev",
-    "e.g",
-    "No",
-    "Nos",
-    "Art",
-    "Nr",
-    "[a-z]",
-]
-
-es = [
-    "sra?s?",
-    "exm[ao]s?",
-    "ns?",
-    "nos?",
-    "doc",
-    "ac",
-    "publ",
-    "ex",
-    "lv",
-    "vlr?",
-    "vls?",
-    "exmo(a)",
-    "ilmo(a)",
-    "av",
-    "of",
-    "min",
-    "livr?",
-    "co?ls?",
-    "univ",
-    "resp",
-    "cli",
-    "lb",
-    "dra?s?",
-    r"[a-z]+r\(as?\)",
-    "ed",
-    "pa?g",
-    "cod",
-    "prof",
-    "op",
-    "plan",
-    "edf?",
-    "func",
-    "ch",
-    "arts?",
-    "artigs?",
-    "artg",
-    "pars?",
-    "rel",
-    "tel",
-    "res",
-    "[a-z]",
-    "vls?",
-    "gab",
-    "bel",
-    "ilm[oa]",
-    "parc",
-    "proc",
-    "adv",
-    "vols?",
-    "cels?",
-    "pp",
-    "ex[ao]",
-    "eg",
-    "pl",
-    "ref",
-    "reg",
-    "f[ilí]s?",
-    "inc",
-    "par",
-    "alin",
-    "fts",
-    "publ?",
-    "ex",
-    "v. em",
-    "v.rev",
-]
+import pkgutil
+import re
+from typing import Dict, Iterable, List, Optional, Pattern
+
+__all__ = (
+    "AbbreviationMatcher",
+    "get_matcher",
+    "get_abbreviations",
+    "register_language",
+)
+
+# Built-in language packs are stored as data files in "easytxt/data" and
+# are only read and compiled when a language is used for the first time.
+LANGUAGE_PACK_PATH = "data/abbreviations/{}.txt"
+
+# Regex syntax that lets an abbreviation match text of any length
+_UNBOUNDED_RE = re.compile(r"[+*{]|\\\d|\(\?P=")
+
+# Last whitespace char of the searched text and the word after it
+_LAST_SPACE_RE = re.compile(r"\s\S*\Z")
+
+
+class AbbreviationMatcher:
+    """Check whether a sentence ends with an abbreviation and a stop key.
+
+    Abbreviations are case-insensitive regular expressions. Each one must be
+    preceded by whitespace, "," or "(", except the first one, which matches
+    anywhere. Most abbreviations can only match a limited number of
+    characters, so only the end of the sentence is searched for them. Those
+    of any length are searched in the last word, unless they can match
+    whitespace too, and only then in the whole sentence.
+    """
+
+    def __init__(self, abbreviations: Iterable[str]):
+        bounded_patterns = []
+        word_patterns = []
+        sentence_patterns = []
+
+        # Longest text that a bounded abbreviation, with the character before
+        # it, can match. A regex never matches more characters than it is
+        # written with, unless it repeats or refers back to a group.
+        self._bounded_max_length = 0
+
+        for index, abbreviation in enumerate(abbreviations):
+            if index == 0:
+                pattern = abbreviation
+            else:
+                pattern = r"[\s,\(]" + abbreviation
+
+            if not _UNBOUNDED_RE.search(abbreviation):
+                bounded_patterns.append(pattern)
+
+                self._bounded_max_length = max(
+                    self._bounded_max_length, len(abbreviation) + min(index, 1)
+                )
+            elif _can_match_space(abbreviation):
+                sentence_patterns.append(pattern)
+            else:
+                word_patterns.append(pattern)
+
+        # Together the same regex as all abbreviations joined into one
+        self._bounded_re: Optional[Pattern] = None
+        self._word_re: Optional[Pattern] = None
+        self._sentence_re: Optional[Pattern] = None
+
+        if bounded_patterns or not (word_patterns or sentence_patterns):
+            self._bounded_re = _compile_abbreviations_re(bounded_patterns)
+
+        if word_patterns:
+            self._word_re = _compile_abbreviations_re(word_patterns)
+
+        if sentence_patterns:
+            self._sentence_re = _compile_abbreviations_re(sentence_patterns)
+
+    def endswith_abbreviation(
+        self,
+        text: str,
+        start: int = 0,
+        end: int = -1,
+    ) -> bool:
+
+        if end < 0:
+            end = len(text)
+
+        pos = end
+
+        while pos > start and text[pos - 1].isspace():
+            pos -= 1
+
+        if pos <= start or text[pos - 1] != ".":
+            return False
+
+        if self._bounded_re is not None:
+            # a match ends at the stop key, so it can't start any earlier
+            search_start = max(start, pos - 1 - self._bounded_max_length)
+
+            if self._bounded_re.search(text, search_start, end):
+                return True
+
+        if self._word_re is not None:
+            # a match can't span whitespace, besides the one before it
+            search_start = _find_last_space(text, start, pos - 1)
+
+            if self._word_re.search(text, search_start, end):
+                return True
+
+        if self._sentence_re is not None:
+            return bool(self._sentence_re.search(text, start, end))
+
+        return False
+
+    def context_start(self, text: str, start: int = 0, end: int = -1) -> int:
+        """Earliest index of text that ``endswith_abbreviation`` reads for a
+        sentence from ``start`` to ``end`` or to any later end, however the
+        text continues after ``end``."""
+
+        if end < 0:
+            end = len(text)
+
+        if self._sentence_re is not None:
+            return start
+
+        context_start = end - 1 - self._bounded_max_length
+
+        if self._word_re is not None:
+            context_start = min(
+                context_start, _find_last_space(text, start, max(start, end - 1))
+            )
+
+        return max(start, context_start)
+
+
+_registered_languages: Dict[str, List[str]] = {}
+
+_matchers: Dict[str, AbbreviationMatcher] = {}
+
+
+def register_language(language: str, abbreviations: Iterable[str]) -> None:
+    """Register (or replace) the abbreviations used for a language code."""
+
+    _registered_languages[language] = list(abbreviations)
+    _matchers.pop(language, None)
+
+
+def get_abbreviations(language: str = "en") -> List[str]:
+    if language in _registered_languages:
+        return list(_registered_languages[language])
+
+    data = None
+
+    if language.replace("-", "").replace("_", "").isalnum():
+        try:
+            data = pkgutil.get_data(__package__, LANGUAGE_PACK_PATH.format(language))
+        except FileNotFoundError:
+            pass
+
+    if data is None:
+        raise ValueError(
+            "Abbreviations for language '{}' are not available".format(language)
+        )
+
+    return _parse_language_pack(data.decode("utf-8"))
+
+
+def get_matcher(language: str = "en") -> AbbreviationMatcher:
+    matcher = _matchers.get(language)
+
+    if matcher is None:
+        matcher = AbbreviationMatcher(get_abbreviations(language))
+        _matchers[language] = matcher
+
+    return matcher
+
+
+def __getattr__(name: str) -> List[str]:
+    # Keep ``abbreviations.en`` style access working for built-in packs.
+    if name.isalpha() and name.islower():
+        try:
+            return get_abbreviations(name)
+        except ValueError:
+            pass
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def _parse_language_pack(data: str) -> List[str]:
+    return [
+        line.strip()
+        for line in data.splitlines()
+        if line.strip() and not line.startswith("#")
+    ]
+
+
+def _compile_abbreviations_re(patterns: List[str]) -> Pattern:
+    return re.compile(r"(?:{})\.\s*$".format("|".join(patterns)), re.IGNORECASE)
+
+
+def _can_match_space(abbreviation: str) -> bool:
+    """Whether an abbreviation regex may match whitespace, judged by its
+    syntax alone. Any char, negated or non-ascii sets, inline flags and
+    escapes besides digit, word and punctuation ones are assumed to."""
+
+    in_set = False
+    index = 0
+
+    while index < len(abbreviation):
+        char = abbreviation[index]
+
+        if char == "\\":
+            escaped_char = abbreviation[index + 1 : index + 2]
+
+            if not escaped_char or escaped_char.isspace():
+                return True
+
+            if escaped_char.isalnum() and escaped_char not in "dwb":
+                return True
+
+            index += 2
+            continue
+
+        if char.isspace() or ord(char) < 0x21 or (in_set and ord(char) > 0x7E):
+            return True
+
+        if char == "[":
+            in_set = True
+
+            if abbreviation.startswith("^", index + 1):
+                return True
+        elif char == "]":
+            in_set = False
+        elif not in_set and char == ".":
+            return True
+        elif not in_set and abbreviation.startswith("(?", index):
+            if not abbreviation.startswith("(?:", index):
+                return True
+
+        index += 1
+
+    return False
+
+
+def _find_last_space(text: str, start: int, end: int) -> int:
+    """Index of the last whitespace char in text[start:end], start if there is
+    none. Only as much of the text as needed is searched, from the end."""
+
+    window_length = 64
+
+    while True:
+        window_start = max(start, end - window_length)
+        space_match = _LAST_SPACE_RE.search(text, window_start, end)
+
+        if space_match:
+            return space_match.start()
+
+        if window_start == start:
+            return start
+
+        window_length *= 4
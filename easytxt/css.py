@@ -0,0 +1,131 @@
+import threading
+from collections import namedtuple
+from typing import Dict, Iterable, List, Union
+
+from lxml import etree
+from pyquery import PyQuery
+from pyquery.cssselectpatch import JQueryTranslator
+
+__all__ = (
+    "select",
+    "compile_selector",
+    "preload_selectors",
+    "clear_selector_cache",
+    "selector_cache_info",
+)
+
+SelectorCacheInfo = namedtuple(
+    "SelectorCacheInfo", ["hits", "misses", "size", "maxsize"]
+)
+
+
+def select(
+    html_data: Union[PyQuery, List[etree._Element]],
+    selector: str,
+) -> List[etree._Element]:
+    """Select the same elements as ``PyQuery(html_data)(selector)``, with the
+    selector translated to XPath only once per process."""
+
+    if isinstance(html_data, PyQuery) and not _has_default_translation(html_data):
+        return list(html_data(selector))
+
+    if not selector:
+        return []
+
+    xpath = compile_selector(selector)
+
+    return [el for element in html_data for el in xpath(element)]
+
+
+def compile_selector(selector: str) -> etree.XPath:
+    """Compiled XPath of a css selector, translated as PyQuery does it."""
+
+    return _selector_cache.get(selector)
+
+
+def preload_selectors(selectors: Iterable[str]) -> None:
+    """Compile known selectors up front, so that invalid ones fail early."""
+
+    for selector in selectors:
+        compile_selector(selector)
+
+
+def clear_selector_cache() -> None:
+    _selector_cache.clear()
+
+
+def selector_cache_info() -> SelectorCacheInfo:
+    """Return counters and size of the compiled selector cache."""
+
+    return _selector_cache.info()
+
+
+class _SelectorCache:
+    """Thread safe cache of compiled selectors, cleared when it is full."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._translator = JQueryTranslator(xhtml=False)
+        self._xpaths: Dict[str, etree.XPath] = {}
+
+    def get(self, selector: str) -> etree.XPath:
+        xpath = self._xpaths.get(selector)
+
+        if xpath is not None:
+            with self._lock:
+                self.hits += 1
+
+            return xpath
+
+        # Compiled outside of the lock, another thread may compile it too
+        xpath = etree.XPath(
+            self._translator.css_to_xpath(
+                selector.replace("[@", "["), prefix="descendant-or-self::"
+            )
+        )
+
+        with self._lock:
+            self.misses += 1
+
+            if len(self._xpaths) >= self.maxsize:
+                self._xpaths.clear()
+
+            self._xpaths[selector] = xpath
+
+        return xpath
+
+    def clear(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self._xpaths.clear()
+
+    def info(self) -> SelectorCacheInfo:
+        with self._lock:
+            return SelectorCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                size=len(self._xpaths),
+                maxsize=self.maxsize,
+            )
+
+
+def _has_default_translation(pq: PyQuery) -> bool:
+    """PyQuery objects parsed as xml or with namespaces translate selectors
+    differently, those are left to PyQuery itself."""
+
+    translator = pq._translator
+
+    return (
+        not pq.namespaces
+        and type(translator) is JQueryTranslator
+        and not translator.xhtml
+    )
+
+
+_selector_cache = _SelectorCache()
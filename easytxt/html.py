@@ -1,10 +1,11 @@
 import re
-from typing import List, Optional, Union
+from copy import deepcopy
+from typing import Iterator, List, Optional, Set, Union
 
 from lxml import etree
 from pyquery import PyQuery
 
-from easytxt.config import HTML_RE_VALIDATOR, INLINE_TAGS
+from easytxt import config, css
 from easytxt.parsers.table import TableParser
 
 __all__ = (
@@ -14,6 +15,12 @@ __all__ = (
     "to_pq",
 )
 
+INLINE_TAGS = frozenset(config.INLINE_TAGS)
+TABLE_TAGS = frozenset(("table", "tr", "td", "th", "tbody", "thead"))
+
+TAG_RE = re.compile(r"<(/?)([a-z]+)", re.IGNORECASE)
+VOID_TAG_RE = re.compile(r"<(?:br|hr|input|wbr)", re.IGNORECASE)
+
 
 def to_sentences(
     html_data: Union[str, PyQuery],
@@ -28,23 +35,32 @@ def to_sentences(
         pq_object = PyQuery(html_data)
 
     if css_query:
-        pq_object = pq_object(css_query)
+        pq_object = PyQuery(
+            css.select(pq_object, css_query),
+            parent=pq_object,
+            namespaces=pq_object.namespaces,
+        )
 
-    # remove scripts and styles otherwise there could be errors when
+    # exclude scripts and styles otherwise there could be errors when
     # converting html to text
-    pq_object.remove("script")
-    pq_object.remove("style")
+    exclude_selectors = ["script", "style"]
 
     if exclude_css:
         if isinstance(exclude_css, str):
             exclude_css = [exclude_css]
 
-        for exclude_css_selector in exclude_css:
-            pq_object.remove(exclude_css_selector)
+        exclude_selectors += exclude_css
+
+    # excluded elements are skipped while walking the tree instead of being
+    # removed from it, so the same parsed html can be used again
+    excluded = {
+        el for selector in exclude_selectors for el in css.select(pq_object, selector)
+    }
 
     raw_sentences = _to_raw_sentences(
         html_text=pq_object,
         max_chars=max_chars,
+        excluded=excluded,
     )
 
     sentences = []
@@ -58,27 +74,41 @@ def to_sentences(
 def _to_raw_sentences(
     html_text: Union[str, PyQuery],
     max_chars: int = 1,
+    excluded: Optional[Set[etree._Element]] = None,
 ) -> List[str]:
 
-    pq = to_pq(html_text)
+    elements = list(to_pq(html_text))
+    excluded = excluded or set()
+    text_elements = _get_text_elements(elements, excluded)
 
-    if not pq.text():
+    # PyQuery.text() joins texts of several elements with a space, so it is
+    # only empty for a single element without text
+    if not elements or (
+        len(elements) == 1 and not _has_text(elements[0], text_elements, excluded)
+    ):
         return []
 
-    raw_sentences = []
+    return _contents_to_raw_sentences(elements, text_elements, excluded, max_chars)
 
-    if _pq_has_only_inline_tags(pq):
-        inline_raw_sentences = _pq_content_to_sentences(pq)
 
-        raw_sentences.append(" ".join(inline_raw_sentences))
-    else:
-        raw_sentences += _pq_content_to_sentences(pq, raw_sentences)
+def validate(text: str, max_chars: Optional[int] = None) -> bool:
+    """Detect html the way config.HTML_RE_VALIDATOR does, in linear time.
 
-    return [rs for rs in raw_sentences if rs and len(rs.strip()) > max_chars]
+    Only the first ``max_chars`` characters are scanned, by default
+    ``config.HTML_VALIDATE_MAX_CHARS`` (all when None).
+    """
+
+    if "<" not in text:
+        return False
 
+    if max_chars is None:
+        max_chars = config.HTML_VALIDATE_MAX_CHARS
 
-def validate(text: str) -> bool:
-    return bool(re.search(HTML_RE_VALIDATOR, text, re.IGNORECASE))
+    if max_chars is not None:
+        text = text[:max_chars]
+
+    # regex matches never span lines since "." doesn't match a newline
+    return any(_validate_line(line) for line in text.split("\n") if "<" in line)
 
 
 def validate_html_table(text: str) -> bool:
@@ -92,41 +122,214 @@ def to_pq(html_text: Union[str, PyQuery]) -> PyQuery:
         return PyQuery(html_text)
 
 
-def _pq_content_to_sentences(
-    pq: PyQuery,
-    raw_sentences: Optional[List[str]] = None,
+def _contents_to_raw_sentences(
+    elements: List[etree._Element],
+    text_elements: Set[etree._Element],
+    excluded: Set[etree._Element],
+    max_chars: int = 1,
 ) -> List[str]:
 
-    if not raw_sentences:
-        raw_sentences = []
+    raw_sentences = []
+
+    for el in _iter_contents(elements, excluded):
+        if isinstance(el, str):
+            raw_sentences.append(el.strip())
+        elif el.tag == "br":
+            raw_sentences.append("<break>")
+        elif el.tag in TABLE_TAGS:
+            # table parser reads the element in place, without reparsing it
+            table_element = elements[0] if el.tag != "table" else el
 
-    for el in pq.contents():
-        if isinstance(el, etree._Element) and el.tag == "br":
-            el = "<break>"
+            raw_sentences += TableParser(
+                _without_excluded(table_element, excluded)
+            ).sentences
 
-        if isinstance(el, etree._Element) and _has_table_tag(el.tag):
             if el.tag != "table":
-                table_html = pq.outer_html()
-            else:
-                table_html = PyQuery(el).outer_html()
+                break
 
-            raw_sentences += TableParser(table_html).sentences
+        elif _has_text(el, text_elements, excluded):
+            raw_sentences += _contents_to_raw_sentences([el], text_elements, excluded)
 
-            if el.tag != "table":
+    if _has_only_inline_tags(elements, excluded):
+        raw_sentences = [" ".join(raw_sentences)]
+
+    return [rs for rs in raw_sentences if rs and len(rs.strip()) > max_chars]
+
+
+def _iter_contents(
+    elements: List[etree._Element], excluded: Set[etree._Element]
+) -> Iterator:
+    """Text nodes and child elements in document order, as PyQuery.contents()
+    returns them (comments are skipped, their tails are not).
+
+    Excluded children are left out and their tails joined to the previous
+    text node, the same as PyQuery.remove() would leave them.
+    """
+
+    for element in elements:
+        if not isinstance(element.tag, str):
+            continue
+
+        text = element.text
+
+        for child in element:
+            if child in excluded:
+                if child.tail:
+                    text = (text or "") + child.tail
+
+                continue
+
+            if text:
+                yield text
+
+            if isinstance(child.tag, str):
+                yield child
+
+            text = child.tail
+
+        if text:
+            yield text
+
+
+def _get_text_elements(
+    elements: List[etree._Element], excluded: Set[etree._Element]
+) -> Set[etree._Element]:
+    """Elements whose PyQuery.text() is not empty, found in one pass by
+    marking the ancestors of every visible text node."""
+
+    text_elements = set()
+
+    def add_with_ancestors(element: Optional[etree._Element]) -> None:
+        while element is not None and element not in text_elements:
+            text_elements.add(element)
+
+            # an excluded element is not part of its parent's text, even
+            # when it is one of the selected elements itself
+            if element in excluded:
                 break
 
-        elif isinstance(el, str):
-            raw_sentences.append(el.strip())
-        elif PyQuery(el).text():
-            raw_sentences += _to_raw_sentences(el)
+            element = element.getparent()
 
-    return raw_sentences
+    nodes = list(elements)
 
+    while nodes:
+        node = nodes.pop()
 
-def _pq_has_only_inline_tags(pq: PyQuery) -> bool:
-    children_tags = [el.tag for el in pq.children()]
-    return all([tag in INLINE_TAGS for tag in children_tags])
+        if isinstance(node.tag, str) and _is_visible_text(node.text):
+            add_with_ancestors(node)
 
+        for child in node:
+            if _is_visible_text(child.tail):
+                add_with_ancestors(node)
 
-def _has_table_tag(tag: str) -> bool:
-    return tag in ["table", "tr", "td", "th", "tbody", "thead"]
+            if child not in excluded:
+                nodes.append(child)
+
+    return text_elements
+
+
+def _has_text(
+    element: etree._Element,
+    text_elements: Set[etree._Element],
+    excluded: Set[etree._Element],
+) -> bool:
+
+    if element.tag == "textarea":
+        # PyQuery.text() returns raw inner html of a textarea
+        return bool(PyQuery(_without_excluded(element, excluded)).text())
+
+    return element in text_elements
+
+
+def _without_excluded(
+    element: etree._Element, excluded: Set[etree._Element]
+) -> etree._Element:
+    """Element itself or, when it contains excluded elements, a copy of it
+    with those removed."""
+
+    if not excluded or not any(el in excluded for el in element.iterdescendants()):
+        return element
+
+    element_copy = deepcopy(element)
+
+    PyQuery(
+        [
+            el_copy
+            for el, el_copy in zip(
+                element.iterdescendants(), element_copy.iterdescendants()
+            )
+            if el in excluded
+        ]
+    ).remove()
+
+    return element_copy
+
+
+def _is_visible_text(text: Optional[str]) -> bool:
+    """Same test as PyQuery.text() uses: anything besides html whitespace."""
+
+    if not text or not text.strip():
+        return False
+
+    return "\u200b" not in text or bool(text.replace("\u200b", " ").strip())
+
+
+def _validate_line(line: str) -> bool:
+    # <br>, <hr>, <input> or <wbr> with a ">" after it
+    void_tag_match = VOID_TAG_RE.search(line)
+
+    if void_tag_match and ">" in line[void_tag_match.end() :]:
+        return True
+
+    tag_matches = list(TAG_RE.finditer(line))
+    open_tag_matches = [tm for tm in tag_matches if not tm.group(1)]
+
+    if not open_tag_matches:
+        return False
+
+    # self closing tag like <img src="x" />: a space after the first opening
+    # tag and a "/>" after that space
+    space_index = line.find(" ", open_tag_matches[0].end())
+    self_closing_index = max(line.rfind("/>"), line.rfind("/ >"))
+
+    if space_index != -1 and space_index < self_closing_index:
+        return True
+
+    # closing tag like </p> whose name starts the name of an earlier opening
+    # tag (the regex back reference may capture any prefix of it)
+    close_tag_lengths = {
+        len(tm.group(2))
+        for tm in tag_matches
+        if tm.group(1) and line.startswith(">", tm.end())
+    }
+
+    if not close_tag_lengths:
+        return False
+
+    open_tag_prefixes: Set[str] = set()
+
+    for tag_match in tag_matches:
+        tag_name = tag_match.group(2).lower()
+
+        if not tag_match.group(1):
+            open_tag_prefixes.update(
+                tag_name[:length]
+                for length in close_tag_lengths
+                if length <= len(tag_name)
+            )
+        elif tag_name in open_tag_prefixes and line.startswith(">", tag_match.end()):
+            return True
+
+    return False
+
+
+def _has_only_inline_tags(
+    elements: List[etree._Element], excluded: Set[etree._Element]
+) -> bool:
+
+    return all(
+        child.tag in INLINE_TAGS
+        for el in elements
+        for child in el
+        if child not in excluded
+    )
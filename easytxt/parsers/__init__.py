@@ -1,10 +1,35 @@
-from typing import List, Optional, Union
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from functools import partial
+from operator import methodcaller
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from pyquery import PyQuery
 
 from easytxt import text as utext
 
-__all__ = ("parse_string",)
+__all__ = (
+    "parse_string",
+    "parse_strings",
+    "StringParser",
+    "enable_parse_string_cache",
+    "disable_parse_string_cache",
+    "parse_string_cache_info",
+)
+
+ParseStringCacheInfo = namedtuple(
+    "ParseStringCacheInfo",
+    ["hits", "misses", "evictions", "size", "bytes", "maxsize", "max_bytes"],
+)
+
+_parse_string_cache: Optional["_ParseStringCache"] = None
+
+# Compiled parsers for parse_string, cleared when there are more
+MAX_STRING_PARSERS = 1024
+
+_string_parsers: Dict[str, "StringParser"] = {}
+_string_parsers_lock = threading.Lock()
 
 
 def parse_string(
@@ -14,7 +39,7 @@ def parse_string(
     title: bool = False,
     uppercase: bool = False,
     lowercase: bool = False,
-    replace_keys: Optional[list] = None,
+    replace_keys: Optional[Union[list, utext.ReplacementTable]] = None,
     remove_keys: Optional[list] = None,
     split_key: Optional[Union[str, tuple]] = None,
     split_keys: Optional[List[Union[str, tuple]]] = None,
@@ -30,133 +55,393 @@ def parse_string(
     add_stop: Optional[Union[bool, str]] = None,
 ) -> str:
 
-    split_keys = [split_key] if split_key else split_keys
+    # Options are compiled once into a StringParser and reused for calls
+    # with the same options
+    return _get_string_parser(
+        normalize,
+        capitalize,
+        title,
+        uppercase,
+        lowercase,
+        replace_keys,
+        remove_keys,
+        split_key,
+        split_keys,
+        take,
+        take_strip,
+        skip,
+        skip_strip,
+        text_num_to_numeric,
+        language,
+        fix_spaces,
+        escape_new_lines,
+        new_line_replacement,
+        add_stop,
+    )(raw_text)
 
-    raw_text = utext.to_str(raw_text)
 
-    if normalize:
-        raw_text = utext.normalize(
-            text=raw_text,
+def parse_strings(
+    raw_texts: Iterable[Optional[Union[str, float, int, bytes, PyQuery]]],
+    as_array: bool = False,
+    **options: Any,
+) -> Union[List[str], Any]:
+    """Parse a list or column of values with the same ``parse_string`` options.
+
+    Identical values are parsed only once. With ``as_array`` a NumPy object
+    array is returned instead of a list, for which NumPy has to be installed.
+    """
+
+    parsed_texts = StringParser(**options).parse_many(raw_texts)
+
+    if as_array:
+        import numpy
+
+        parsed_array = numpy.empty(len(parsed_texts), dtype=object)
+        parsed_array[:] = parsed_texts
+
+        return parsed_array
+
+    return parsed_texts
+
+
+class StringParser:
+    """Compiled ``parse_string`` options for parsing many values the same way.
+
+    Options are the same as the ``parse_string`` ones. They are checked and
+    compiled once into a plan of only the needed steps, so that
+    ``StringParser(**options)(value)`` equals ``parse_string(value, **options)``.
+    Parsers can be pickled, for example to be sent to worker processes.
+    """
+
+    def __init__(
+        self,
+        normalize: bool = True,
+        capitalize: bool = False,
+        title: bool = False,
+        uppercase: bool = False,
+        lowercase: bool = False,
+        replace_keys: Optional[Union[list, utext.ReplacementTable]] = None,
+        remove_keys: Optional[list] = None,
+        split_key: Optional[Union[str, tuple]] = None,
+        split_keys: Optional[List[Union[str, tuple]]] = None,
+        take: Optional[int] = None,
+        take_strip: bool = True,
+        skip: Optional[int] = None,
+        skip_strip: bool = True,
+        text_num_to_numeric: bool = False,
+        language: str = "en",
+        fix_spaces: bool = True,
+        escape_new_lines: bool = True,
+        new_line_replacement: str = " ",
+        add_stop: Optional[Union[bool, str]] = None,
+    ):
+
+        self.options: Dict[str, Any] = dict(
+            normalize=normalize,
+            capitalize=capitalize,
+            title=title,
+            uppercase=uppercase,
+            lowercase=lowercase,
+            replace_keys=replace_keys,
+            remove_keys=remove_keys,
+            split_key=split_key,
+            split_keys=split_keys,
+            take=take,
+            take_strip=take_strip,
+            skip=skip,
+            skip_strip=skip_strip,
+            text_num_to_numeric=text_num_to_numeric,
+            language=language,
             fix_spaces=fix_spaces,
             escape_new_lines=escape_new_lines,
             new_line_replacement=new_line_replacement,
+            add_stop=add_stop,
         )
 
-    raw_text = _parse_string_chars(
-        raw_text=raw_text,
-        replace_keys=replace_keys,
-        remove_keys=remove_keys,
-        split_keys=split_keys,
-        text_num_to_numeric=text_num_to_numeric,
-        language=language,
-    )
-
-    raw_text = _parse_string_case(
-        raw_text=raw_text,
-        capitalize=capitalize,
-        title=title,
-        uppercase=uppercase,
-        lowercase=lowercase,
-    )
+        self._steps = _compile_parse_string_steps(**self.options)
+        self._fingerprint = _get_options_fingerprint(tuple(self.options.values()))
 
-    if fix_spaces:
-        raw_text = utext.normalize_spaces(raw_text)
+    def __call__(
+        self,
+        raw_text: Optional[Union[str, float, int, bytes, PyQuery]],
+    ) -> str:
 
-    raw_text = _parse_string_char_limit(
-        raw_text=raw_text,
-        take=take,
-        take_strip=take_strip,
-        skip=skip,
-        skip_strip=skip_strip,
-    )
+        if not isinstance(raw_text, str):
+            raw_text = utext.to_str(raw_text)
 
-    if add_stop:
-        if isinstance(add_stop, bool):
-            stop_key = "."
-        else:
-            stop_key = add_stop
+        parse_string_cache = _parse_string_cache
+
+        if parse_string_cache is not None and isinstance(raw_text, str):
+            return parse_string_cache.parse(self._fingerprint, raw_text, self._parse)
+
+        return self._parse(raw_text)
+
+    def _parse(self, raw_text: str) -> str:
+        for step in self._steps:
+            raw_text = step(raw_text)
+
+        return raw_text
+
+    def parse_many(
+        self,
+        raw_texts: Iterable[Optional[Union[str, float, int, bytes, PyQuery]]],
+    ) -> List[str]:
+        """Parse many values, running each step once per distinct value."""
+
+        texts: List[str] = [
+            raw_text if isinstance(raw_text, str) else utext.to_str(raw_text)
+            for raw_text in raw_texts
+        ]
+
+        distinct_indexes: Dict[str, int] = {}
+
+        indexes = [
+            distinct_indexes.setdefault(text, len(distinct_indexes)) for text in texts
+        ]
+
+        parsed_texts = list(distinct_indexes)
+
+        for step in self._steps:
+            parsed_texts = list(map(step, parsed_texts))
+
+        return [parsed_texts[i] for i in indexes]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Steps are compiled again after unpickling
+        return self.options
+
+    def __setstate__(self, options: Dict[str, Any]):
+        self.options = options
+        self._steps = _compile_parse_string_steps(**options)
+        self._fingerprint = _get_options_fingerprint(tuple(options.values()))
+
+
+class _ParseStringCache:
+    """Thread safe LRU cache of parsed texts, bounded by count and bytes.
+
+    Texts are cached by their options fingerprint and text, so parsers with
+    the same options share them. Bytes are the sizes of the input and parsed
+    texts, without the overhead of the cache itself.
+    """
+
+    def __init__(self, maxsize: int, max_bytes: int):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+
+        self._lock = threading.Lock()
+        self._parsed_texts: "OrderedDict[tuple, Tuple[str, int]]" = OrderedDict()
+
+    def parse(
+        self,
+        fingerprint: str,
+        raw_text: str,
+        parse: Callable[[str], str],
+    ) -> str:
+
+        key = (fingerprint, raw_text)
+        parsed_texts = self._parsed_texts
+
+        # Reading without the lock is safe, as get is a single atomic call
+        cached = parsed_texts.get(key)
+
+        if cached is not None:
+            with self._lock:
+                self.hits += 1
+
+                # Another thread may have evicted it in the meantime
+                if key in parsed_texts:
+                    parsed_texts.move_to_end(key)
+
+            return cached[0]
+
+        # Parsed outside of the lock, another thread may parse it too
+        parsed_text = parse(raw_text)
+        size = sys.getsizeof(raw_text) + sys.getsizeof(parsed_text)
+
+        with self._lock:
+            self.misses += 1
+
+            if size > self.max_bytes or key in parsed_texts:
+                return parsed_text
+
+            parsed_texts[key] = (parsed_text, size)
+            self.bytes += size
+
+            while len(parsed_texts) > self.maxsize or self.bytes > self.max_bytes:
+                _, (_, evicted_size) = parsed_texts.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+        return parsed_text
+
+    def info(self) -> ParseStringCacheInfo:
+        with self._lock:
+            return ParseStringCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self._parsed_texts),
+                bytes=self.bytes,
+                maxsize=self.maxsize,
+                max_bytes=self.max_bytes,
+            )
+
+
+def enable_parse_string_cache(
+    maxsize: int = 65536,
+    max_bytes: int = 64 * 1024 * 1024,
+) -> None:
+    """Cache results of ``parse_string`` and ``StringParser`` for repeated texts.
+
+    Up to ``maxsize`` results are kept, using at most about ``max_bytes`` for
+    the texts, and the least recently used ones are evicted first.
+    """
+
+    global _parse_string_cache
+
+    _parse_string_cache = _ParseStringCache(maxsize=maxsize, max_bytes=max_bytes)
+
+
+def disable_parse_string_cache() -> None:
+    global _parse_string_cache
+
+    _parse_string_cache = None
 
-        raw_text = utext.add_stop_key(text=raw_text, stop_key=stop_key)
 
-    return raw_text
+def parse_string_cache_info() -> Optional[ParseStringCacheInfo]:
+    """Return counters and size of the parse_string cache, None if disabled."""
 
+    if _parse_string_cache is None:
+        return None
 
-def _parse_string_chars(
-    raw_text: str,
-    replace_keys: Optional[list] = None,
+    return _parse_string_cache.info()
+
+
+def _get_string_parser(*options: Any) -> StringParser:
+    """Compiled parser for parse_string options, made once per options."""
+
+    fingerprint = _get_options_fingerprint(options)
+
+    string_parser = _string_parsers.get(fingerprint)
+
+    if string_parser is None:
+        string_parser = StringParser(*options)
+
+        with _string_parsers_lock:
+            if len(_string_parsers) >= MAX_STRING_PARSERS:
+                _string_parsers.clear()
+
+            _string_parsers[fingerprint] = string_parser
+
+    return string_parser
+
+
+def _get_options_fingerprint(options: tuple) -> str:
+    """Options as a string, which keeps them apart by type as well.
+
+    Option values are strings, numbers, booleans, lists and tuples of them or
+    replacement tables, whose repr tells them apart exactly. Equal values that
+    parse differently, like ``add_stop=True`` and ``add_stop=1``, or a split
+    key tuple and list, get different fingerprints.
+    """
+
+    return repr(options)
+
+
+def _compile_parse_string_steps(
+    normalize: bool = True,
+    capitalize: bool = False,
+    title: bool = False,
+    uppercase: bool = False,
+    lowercase: bool = False,
+    replace_keys: Optional[Union[list, utext.ReplacementTable]] = None,
     remove_keys: Optional[list] = None,
+    split_key: Optional[Union[str, tuple]] = None,
     split_keys: Optional[List[Union[str, tuple]]] = None,
+    take: Optional[int] = None,
+    take_strip: bool = True,
+    skip: Optional[int] = None,
+    skip_strip: bool = True,
     text_num_to_numeric: bool = False,
     language: str = "en",
-) -> str:
+    fix_spaces: bool = True,
+    escape_new_lines: bool = True,
+    new_line_replacement: str = " ",
+    add_stop: Optional[Union[bool, str]] = None,
+) -> List[Callable[[str], str]]:
+    """Steps of ``parse_string`` for the given options, in the same order."""
+
+    split_keys = [split_key] if split_key else split_keys
+
+    steps: List[Callable[[str], str]] = []
+
+    if normalize:
+
+        def normalize_step(text: str) -> str:
+            return utext.normalize(
+                text, fix_spaces, escape_new_lines, new_line_replacement
+            )
+
+        steps.append(normalize_step)
+
+    # Normalized spaces are changed only by steps that change chars
+    normalized = normalize and fix_spaces
 
     if replace_keys:
-        raw_text = utext.replace_chars_by_keys(
-            text=raw_text,
-            replace_keys=replace_keys,
-        )
+        steps.append(utext.get_replacement_table(replace_keys).replace)
+        normalized = False
 
     if remove_keys:
-        raw_text = utext.remove_chars_by_keys(
-            text=raw_text,
-            remove_keys=remove_keys,
+        steps.append(
+            utext.get_replacement_table([(key, "") for key in remove_keys]).replace
         )
+        normalized = False
 
     if split_keys:
-        raw_text = utext.split_by_keys(
-            text=raw_text,
-            split_keys=split_keys,
-        )
+        # Bad keys fail here already, instead of on each value. Split indexes
+        # can only be checked with a text to split.
+        for split_key in split_keys:
+            try:
+                utext.split_by_keys("", split_keys=[split_key])
+            except IndexError:
+                pass
 
-    if text_num_to_numeric:
-        raw_text = utext.to_numeric_from_text_num(
-            text=raw_text,
-            language=language,
-        )
+        steps.append(partial(utext.split_by_keys, split_keys=list(split_keys)))
+        normalized = False
 
-    return raw_text
+    if text_num_to_numeric:
+        # Unsupported languages fail here already, instead of on each value
+        utext.to_numeric_from_text_num("", language=language)
 
-
-def _parse_string_case(
-    raw_text: str,
-    capitalize: bool = False,
-    title: bool = False,
-    uppercase: bool = False,
-    lowercase: bool = False,
-) -> str:
+        steps.append(partial(utext.to_numeric_from_text_num, language=language))
+        normalized = False
 
     if capitalize:
-        raw_text = utext.capitalize(raw_text)
+        steps.append(utext.capitalize)
     elif title:
-        raw_text = raw_text.title()
+        steps.append(methodcaller("title"))
     elif uppercase:
-        raw_text = raw_text.upper()
+        steps.append(methodcaller("upper"))
     elif lowercase:
-        raw_text = raw_text.lower()
+        steps.append(methodcaller("lower"))
 
-    return raw_text
+    if fix_spaces:
+        steps.append(partial(utext.normalize_spaces, normalized=normalized))
 
+    # Taking or skipping chars of an empty text always gives an empty text
+    if take:
+        steps.append(partial(utext.take, limit=take, strip=take_strip))
 
-def _parse_string_char_limit(
-    raw_text: str,
-    take: Optional[int] = None,
-    take_strip: bool = True,
-    skip: Optional[int] = None,
-    skip_strip: bool = True,
-) -> str:
+    if skip:
+        steps.append(partial(utext.skip, limit=skip, strip=skip_strip))
 
-    if take and raw_text:
-        raw_text = utext.take(
-            text=raw_text,
-            limit=take,
-            strip=take_strip,
-        )
-
-    if skip and raw_text:
-        raw_text = utext.skip(
-            text=raw_text,
-            limit=skip,
-            strip=skip_strip,
-        )
+    if add_stop:
+        stop_key = "." if isinstance(add_stop, bool) else add_stop
+        steps.append(partial(utext.add_stop_key, stop_key=stop_key))
 
-    return raw_text
+    return steps
@@ -1,7 +1,11 @@
-import re
 from typing import List, Optional, Union
 
+from lxml import etree
 from pyquery import PyQuery
+from pyquery.text import extract_text
+
+from easytxt import css
+from easytxt import text as utext
 
 __all__ = ("TableParser",)
 
@@ -11,12 +15,12 @@ class TableParser:
 
     def __init__(
         self,
-        html_text: Optional[Union[str, PyQuery]] = None,
+        html_text: Optional[Union[str, PyQuery, etree._Element]] = None,
         pq: Optional[PyQuery] = None,
-        allow_cols: Optional[List[str]] = None,
-        callow_cols: Optional[List[str]] = None,
-        deny_cols: Optional[List[str]] = None,
-        cdeny_cols: Optional[List[str]] = None,
+        allow_cols: Optional[Union[List[str], utext.KeywordSet]] = None,
+        callow_cols: Optional[Union[List[str], utext.KeywordSet]] = None,
+        deny_cols: Optional[Union[List[str], utext.KeywordSet]] = None,
+        cdeny_cols: Optional[Union[List[str], utext.KeywordSet]] = None,
         separator: str = "; ",
         header: bool = True,
         skip_row_without_value: bool = True,
@@ -24,6 +28,11 @@ class TableParser:
 
         if isinstance(html_text, str):
             self._pq = PyQuery(html_text)
+        elif isinstance(html_text, PyQuery):
+            self._pq = html_text
+        elif isinstance(html_text, etree._Element):
+            # already parsed tree (e.g. from html.to_sentences) is used as is
+            self._pq = PyQuery(html_text)
         else:
             self._pq = pq
 
@@ -84,8 +93,8 @@ class TableParser:
         if not self.__cached_rows:
             yield from self.__cached_rows
 
-        for tr_pq in self._pq("tr").items():
-            row_data = [td_pq.text() for td_pq in tr_pq("td,th").items()]
+        for tr in css.select(self._pq, "tr"):
+            row_data = [extract_text(td) for td in css.select([tr], "td,th")]
 
             self.__cached_rows.append(row_data)
 
@@ -118,28 +127,27 @@ class TableParser:
         return next(self._iter_list())
 
     def has_header(self) -> bool:
-        if self._pq("th ~ td"):
+        if css.select(self._pq, "th ~ td"):
             return False
 
-        if self._pq("tbody") and not self._pq("thead"):
+        if css.select(self._pq, "tbody") and not css.select(self._pq, "thead"):
             return False
 
-        return bool(self._pq("th")) or bool(self._pq("thead"))
+        return bool(css.select(self._pq, "th")) or bool(css.select(self._pq, "thead"))
 
     def _filter_allow_cols(
         self,
         table_row_dict: dict,
-        allow_cols: List[str],
+        allow_cols: Union[List[str], utext.KeywordSet],
         case_sensitive: bool = False,
     ) -> dict:
 
-        ignore_case = 0 if case_sensitive else re.IGNORECASE
+        keyword_set = utext.get_keyword_set(allow_cols, case_sensitive)
 
         filtered_row_dict = {}
 
         for key, value in table_row_dict.items():
-            if any(re.search(allow_key, key, ignore_case) for allow_key in allow_cols):
-
+            if keyword_set.contains(key):
                 filtered_row_dict[key] = value
 
         return filtered_row_dict
@@ -147,17 +155,16 @@ class TableParser:
     def _filter_deny_cols(
         self,
         table_row_dict: dict,
-        deny_cols: List[str],
+        deny_cols: Union[List[str], utext.KeywordSet],
         case_sensitive: bool = False,
     ) -> dict:
 
-        ignore_case = 0 if case_sensitive else re.IGNORECASE
+        keyword_set = utext.get_keyword_set(deny_cols, case_sensitive)
 
         filtered_row_dict = {}
 
         for key, value in table_row_dict.items():
-            if not any(re.search(deny_key, key, ignore_case) for deny_key in deny_cols):
-
+            if not keyword_set.contains(key):
                 filtered_row_dict[key] = value
 
         return filtered_row_dict
@@ -19,23 +19,23 @@ class TextParser:
         language: str = "en",
         css_query: Optional[str] = None,
         exclude_css: Optional[Union[List[str], str]] = None,
-        allow: Optional[Union[str, List[str]]] = None,
-        callow: Optional[Union[str, List[str]]] = None,
-        from_allow: Optional[Union[str, List[str]]] = None,
-        from_callow: Optional[Union[str, List[str]]] = None,
-        to_allow: Optional[Union[str, List[str]]] = None,
-        to_callow: Optional[Union[str, List[str]]] = None,
-        deny: Optional[Union[str, List[str]]] = None,
-        cdeny: Optional[Union[str, List[str]]] = None,
+        allow: Optional[Union[str, List[str], utext.KeywordSet]] = None,
+        callow: Optional[Union[str, List[str], utext.KeywordSet]] = None,
+        from_allow: Optional[Union[str, List[str], utext.KeywordSet]] = None,
+        from_callow: Optional[Union[str, List[str], utext.KeywordSet]] = None,
+        to_allow: Optional[Union[str, List[str], utext.KeywordSet]] = None,
+        to_callow: Optional[Union[str, List[str], utext.KeywordSet]] = None,
+        deny: Optional[Union[str, List[str], utext.KeywordSet]] = None,
+        cdeny: Optional[Union[str, List[str], utext.KeywordSet]] = None,
         normalize: bool = True,
         capitalize: bool = True,
         title: bool = False,
         uppercase: bool = False,
         lowercase: bool = False,
         min_chars: int = 5,
-        replace_keys: Optional[list] = None,
+        replace_keys: Optional[Union[list, utext.ReplacementTable]] = None,
         remove_keys: Optional[list] = None,
-        replace_keys_raw_text: Optional[list] = None,
+        replace_keys_raw_text: Optional[Union[list, utext.ReplacementTable]] = None,
         remove_keys_raw_text: Optional[list] = None,
         split_inline_breaks: bool = True,
         inline_breaks: Optional[List[str]] = None,
@@ -48,6 +48,7 @@ class TextParser:
         text_num_to_numeric: bool = False,
         autodetect_html: bool = True,
         html_text_to_sentences: bool = True,
+        workers: Optional[int] = None,
     ):
 
         self._text = text
@@ -83,6 +84,7 @@ class TextParser:
         self._text_num_to_numeric = text_num_to_numeric
         self._autodetect_html = autodetect_html
         self._html_text_to_sentences = html_text_to_sentences
+        self._workers = workers
 
     def __iter__(self):
         for sentence in self.sentences:
@@ -193,18 +195,33 @@ class TextParser:
     def _text_to_sentences(self):
         is_pq = isinstance(self._text, PyQuery)
 
+        # Sentences split from text have normalized spaces
+        normalized = True
+
         if is_pq or (self._autodetect_html and html.validate(self._text)):
             raw_sentences = self._html_data_to_raw_sentences(
                 html_raw_data=self._text,
                 html_text_to_sentences=self._html_text_to_sentences,
             )
+
+            normalized = self._html_text_to_sentences
         else:
             raw_sentences = self._text_to_raw_sentences(self._text)
 
-        return self._process_raw_sentences(raw_sentences)
+        return self._process_raw_sentences(raw_sentences, normalized)
+
+    def _process_raw_sentences(
+        self,
+        raw_sentences,
+        normalized: bool = False,
+    ) -> List[str]:
 
-    def _process_raw_sentences(self, raw_sentences) -> List[str]:
         if self._merge_sentences:
+            # Merged sentences are joined by a space, which normalization
+            # would only remove before a dot
+            if normalized and any(rs.startswith(".") for rs in raw_sentences):
+                normalized = False
+
             raw_sentences = sentences.merge(
                 sentences=raw_sentences,
                 stop_keys_ignore=self._stop_keys_ignore,
@@ -214,12 +231,16 @@ class TextParser:
             raw_sentences = sentences.replace_chars_by_keys(
                 sentences=raw_sentences,
                 replace_keys=self._replace_keys,
+                normalized=normalized,
             )
 
+            normalized = True
+
         if self._remove_keys:
             raw_sentences = sentences.remove_chars_by_keys(
                 sentences=raw_sentences,
                 remove_keys=self._remove_keys,
+                normalized=normalized,
             )
 
         raw_sentences = self._min_chars_limit(raw_sentences)
@@ -250,11 +271,23 @@ class TextParser:
             exclude_css=self._exclude_css,
         )
 
-        if html_text_to_sentences:
-            raw_sentences: List[str] = []
-
-            for html_raw_sentence in html_raw_sentences:
-                raw_sentences += self._text_to_raw_sentences(html_raw_sentence)
+        if html_text_to_sentences and html_raw_sentences:
+            # All fragments are normalized together and then split in one
+            # call, with the same sentences as splitting them one by one
+            raw_texts = [
+                self._manage_keys_raw_text(raw_text)
+                for raw_text in self._normalize_raw_texts(html_raw_sentences)
+            ]
+
+            raw_sentences, _ = sentences.from_texts(
+                texts=raw_texts,
+                language=self._language,
+                stop_keys=self._stop_keys_split,
+                split_inline_breaks=self._split_inline_breaks,
+                inline_breaks=self._inline_breaks,
+                min_chars=self._min_chars,
+                normalized=self._is_raw_text_normalized(),
+            )
 
             return raw_sentences
 
@@ -262,7 +295,6 @@ class TextParser:
 
     def _text_to_raw_sentences(self, raw_text: str) -> List[str]:
         raw_text = self._normalize_raw_text(raw_text)
-
         raw_text = self._manage_keys_raw_text(raw_text)
 
         return sentences.from_text(
@@ -272,6 +304,14 @@ class TextParser:
             split_inline_breaks=self._split_inline_breaks,
             inline_breaks=self._inline_breaks,
             min_chars=self._min_chars,
+            workers=self._workers,
+            normalized=self._is_raw_text_normalized(),
+        )
+
+    def _is_raw_text_normalized(self) -> bool:
+        # Spaces are already normalized, unless keys replaced some text
+        return self._normalize and not (
+            self._replace_keys_raw_text or self._remove_keys_raw_text
         )
 
     def _filter_raw_sentences(self, raw_sentences: List[str]) -> List[str]:
@@ -325,6 +365,16 @@ class TextParser:
 
         return raw_text
 
+    def _normalize_raw_texts(self, raw_texts: List[str]) -> List[str]:
+        raw_texts = [utext.to_str(raw_text) for raw_text in raw_texts]
+
+        if self._normalize:
+            raw_texts = utext.normalize_texts(
+                [utext.normalize_breaks(raw_text) for raw_text in raw_texts]
+            )
+
+        return raw_texts
+
     def _sentences_manage_case(self, raw_sentences: List[str]) -> List[str]:
         if self._lowercase:
             raw_sentences = sentences.lowercase(raw_sentences)
@@ -342,10 +392,7 @@ class TextParser:
         raw_sentences: List[str],
     ) -> List[str]:
 
-        return [
-            utext.to_numeric_from_text_num(rs, language=self._language)
-            for rs in raw_sentences
-        ]
+        return utext.to_numeric_from_text_nums(raw_sentences, language=self._language)
 
     def _manage_keys_raw_text(self, raw_text: str):
         if self._replace_keys_raw_text:
@@ -1,12 +1,35 @@
 import re
-from typing import List, Optional, Union
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import (
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+    overload,
+)
 
 from easytxt import abbreviations, config
 from easytxt import text as utext
 
 __all__ = (
     "from_text",
+    "from_texts",
+    "iter_from_text",
+    "Segmenter",
+    "get_segmenter",
+    "SentenceSpans",
+    "segmenter_cache_info",
     "merge",
+    "iter_merge",
     "add_stop",
     "capitalize",
     "title",
@@ -15,6 +38,7 @@ __all__ = (
     "replace_chars_by_keys",
     "remove_chars_by_keys",
     "split_inline_breaks_to_sentences",
+    "iter_split_inline_breaks",
     "remove_empty",
     "allow_contains",
     "from_allow_contains",
@@ -23,6 +47,57 @@ __all__ = (
     "to_text",
 )
 
+# Smallest text chunk worth sending to another process
+PARALLEL_MIN_CHUNK_CHARS = 256 * 1024
+
+_NO_SENTENCE = object()
+
+# Size of "I" array items depends on the platform, "Q" is always 8 bytes
+_MAX_UINT_OFFSET = 2 ** (8 * array("I").itemsize)
+
+
+@overload
+def from_text(
+    text: str,
+    language: str = ...,
+    stop_keys: Optional[List[str]] = ...,
+    split_inline_breaks: bool = ...,
+    inline_breaks: Optional[List[str]] = ...,
+    min_chars: int = ...,
+    spans: Literal[False] = ...,
+    workers: Optional[int] = ...,
+    normalized: bool = ...,
+) -> List[str]: ...
+
+
+@overload
+def from_text(
+    text: str,
+    language: str = ...,
+    stop_keys: Optional[List[str]] = ...,
+    split_inline_breaks: bool = ...,
+    inline_breaks: Optional[List[str]] = ...,
+    min_chars: int = ...,
+    *,
+    spans: Literal[True],
+    workers: Optional[int] = ...,
+    normalized: bool = ...,
+) -> "SentenceSpans": ...
+
+
+@overload
+def from_text(
+    text: str,
+    language: str = ...,
+    stop_keys: Optional[List[str]] = ...,
+    split_inline_breaks: bool = ...,
+    inline_breaks: Optional[List[str]] = ...,
+    min_chars: int = ...,
+    spans: bool = ...,
+    workers: Optional[int] = ...,
+    normalized: bool = ...,
+) -> Union[List[str], "SentenceSpans"]: ...
+
 
 def from_text(
     text: str,
@@ -31,69 +106,532 @@ def from_text(
     split_inline_breaks: bool = True,
     inline_breaks: Optional[List[str]] = None,
     min_chars: int = 5,
-) -> List[str]:
+    spans: bool = False,
+    workers: Optional[int] = None,
+    normalized: bool = False,
+) -> Union[List[str], "SentenceSpans"]:
+
+    segmenter = get_segmenter(
+        language=language,
+        stop_keys=stop_keys,
+        inline_breaks=inline_breaks,
+    )
+
+    if spans:
+        if workers and workers > 1:
+            raise ValueError("Sentence spans can't be split on multiple workers")
+
+        return segmenter.split_spans(
+            text=text,
+            split_inline_breaks=split_inline_breaks,
+            min_chars=min_chars,
+            normalized=normalized,
+        )
 
-    if stop_keys is None:
-        stop_keys = config.STOP_KEYS
+    return segmenter.split(
+        text=text,
+        split_inline_breaks=split_inline_breaks,
+        min_chars=min_chars,
+        workers=workers,
+        normalized=normalized,
+    )
 
-    stop_re = re.compile(r"([{}]\s+)".format("".join(stop_keys)))
 
-    abbr_re = _get_abbr_re_pattern(language)
+def from_texts(
+    texts: Iterable[str],
+    language: str = "en",
+    stop_keys: Optional[List[str]] = None,
+    split_inline_breaks: bool = True,
+    inline_breaks: Optional[List[str]] = None,
+    min_chars: int = 5,
+    normalized: bool = False,
+) -> Tuple[List[str], array]:
+    """Split many texts into sentences in one call.
+
+    Sentences of all texts are returned in one flat list together with an
+    offsets array of ``len(texts) + 1`` items, where sentences of the i-th
+    text are ``sentences[offsets[i]:offsets[i + 1]]``.
+    """
+
+    segmenter = get_segmenter(
+        language=language,
+        stop_keys=stop_keys,
+        inline_breaks=inline_breaks,
+    )
+
+    return segmenter.split_many(
+        texts=texts,
+        split_inline_breaks=split_inline_breaks,
+        min_chars=min_chars,
+        normalized=normalized,
+    )
+
+
+def iter_from_text(
+    text_chunks: Union[IO[str], Iterable[str]],
+    language: str = "en",
+    stop_keys: Optional[List[str]] = None,
+    split_inline_breaks: bool = True,
+    inline_breaks: Optional[List[str]] = None,
+    min_chars: int = 5,
+    chunk_size: int = 65536,
+) -> Iterator[str]:
+    """Yield the same sentences as ``from_text`` from a file or chunks of text.
+
+    Text is read ``chunk_size`` characters at a time from file objects and
+    sentences are yielded as soon as they are complete, so memory use is
+    bounded by the longest sentence and not by the size of the input. Text
+    without any stop is a single sentence, which is kept in memory whole.
+    """
+
+    segmenter = get_segmenter(
+        language=language,
+        stop_keys=stop_keys,
+        inline_breaks=inline_breaks,
+    )
+
+    return segmenter.iter_split(
+        text_chunks=text_chunks,
+        split_inline_breaks=split_inline_breaks,
+        min_chars=min_chars,
+        chunk_size=chunk_size,
+    )
+
+
+class Segmenter:
+    """Compiled sentence segmenter for one language and set of keys.
+
+    Segmenters are expensive to build and cheap to use, so they should be
+    retrieved through ``get_segmenter`` which keeps one per configuration.
+    """
+
+    def __init__(
+        self,
+        language: str = "en",
+        stop_keys: Tuple[str, ...] = tuple(config.STOP_KEYS),
+        inline_breaks: Tuple[str, ...] = tuple(config.INLINE_BREAKS),
+    ):
+
+        self.language = language
+        self.stop_keys = stop_keys
+        self.inline_breaks = inline_breaks
+
+        self._stop_re = re.compile(r"([{}]\s+)".format("".join(stop_keys)))
+        self._inline_breaks_re = _get_inline_breaks_re(inline_breaks)
+
+    def split(
+        self,
+        text: str,
+        split_inline_breaks: bool = True,
+        min_chars: int = 5,
+        workers: Optional[int] = None,
+        normalized: bool = False,
+    ) -> List[str]:
+
+        raw_text = utext.normalize_spaces(text, normalized=normalized)
+
+        abbreviation_matcher = abbreviations.get_matcher(self.language)
+
+        text_chunks = []
+
+        if workers and workers > 1:
+            text_chunks = self._split_to_independent_chunks(
+                text=raw_text,
+                abbreviation_matcher=abbreviation_matcher,
+                min_chars=min_chars,
+                max_chunks=workers,
+            )
+
+        if len(text_chunks) < 2:
+            return _split_text_chunk(
+                self, abbreviation_matcher, raw_text, split_inline_breaks, min_chars
+            )
+
+        sentences = []
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_sentences in executor.map(
+                _split_text_chunk,
+                repeat(self),
+                repeat(abbreviation_matcher),
+                text_chunks,
+                repeat(split_inline_breaks),
+                repeat(min_chars),
+            ):
+                sentences += chunk_sentences
+
+        return sentences
+
+    def split_many(
+        self,
+        texts: Iterable[str],
+        split_inline_breaks: bool = True,
+        min_chars: int = 5,
+        normalized: bool = False,
+    ) -> Tuple[List[str], array]:
+
+        abbreviation_matcher = abbreviations.get_matcher(self.language)
+        normalize_spaces = utext.normalize_spaces
+        stop_re = self._stop_re
+        inline_breaks_split = self._inline_breaks_re.split
+
+        sentences: List[str] = []
+        sentence_spans: Iterable[Tuple[int, int]]
+        offsets = array("Q", [0])
+
+        # Same as split, with the per sentence helpers inlined since most
+        # time goes into call overhead for short texts
+        for text in texts:
+            raw_text = normalize_spaces(text, normalized=normalized)
+
+            if not stop_re.search(raw_text):
+                # No stop followed by more text, so a single sentence
+                sentence_spans = [(0, len(raw_text))]
+            else:
+                sentence_spans = _iter_sentence_spans(
+                    text=raw_text,
+                    stop_re=stop_re,
+                    abbreviation_matcher=abbreviation_matcher,
+                    min_chars=min_chars,
+                )
+
+            for start, end in sentence_spans:
+                sentence = raw_text[start:end].strip()
+
+                if split_inline_breaks:
+                    for part in inline_breaks_split(sentence):
+                        part = part.strip()
+
+                        if len(part) > 2:
+                            sentences.append(part)
+                elif len(sentence) > 2:
+                    sentences.append(sentence)
+
+            offsets.append(len(sentences))
+
+        return sentences, offsets
+
+    def _split_to_independent_chunks(
+        self,
+        text: str,
+        abbreviation_matcher: abbreviations.AbbreviationMatcher,
+        min_chars: int = 5,
+        max_chunks: int = 2,
+    ) -> List[str]:
+        """Cut text only after stops where a sentence surely ends.
+
+        A stop is a sure sentence end when text follows it, the part before
+        it is at least ``min_chars`` long and no abbreviation ends there even
+        with the sentence starting at the start of the chunk. Abbreviations
+        only match more often when the sentence starts earlier, so the
+        outcome doesn't depend on where the sentence started and each chunk
+        can be segmented on its own with the same result as the whole text.
+        """
+
+        chunk_size = max(len(text) // max_chunks, PARALLEL_MIN_CHUNK_CHARS)
+
+        text_chunks = []
+        chunk_start = 0
+
+        while len(text) - chunk_start >= chunk_size * 2:
+            prev_stop_end = None
+
+            for stop_match in self._stop_re.finditer(text, chunk_start + chunk_size):
+                stop_start, stop_end = stop_match.span()
+
+                if (
+                    prev_stop_end is not None
+                    and stop_end < len(text)
+                    and stop_end - prev_stop_end >= min_chars
+                    and not abbreviation_matcher.endswith_abbreviation(
+                        text, chunk_start, stop_end
+                    )
+                ):
+                    break
+
+                prev_stop_end = stop_end
+            else:
+                break
+
+            text_chunks.append(text[chunk_start:stop_end])
+            chunk_start = stop_end
+
+        text_chunks.append(text[chunk_start:])
+
+        return text_chunks
+
+    def iter_split(
+        self,
+        text_chunks: Union[IO[str], Iterable[str]],
+        split_inline_breaks: bool = True,
+        min_chars: int = 5,
+        chunk_size: int = 65536,
+    ) -> Iterator[str]:
+
+        # Trailing whitespace of a chunk is held back until non whitespace
+        # text follows, so that spaces are normalized exactly as they would
+        # be for the whole text. Scanning continues where the previous chunk
+        # ended, so only the new text is scanned. Text of the unfinished
+        # sentence is carried over as a list of parts, besides its end that
+        # abbreviations may still need, which starts the next scanned text.
+        # That end is short, unless it is a very long word and abbreviations
+        # of any length are used.
+        abbreviation_matcher = abbreviations.get_matcher(self.language)
+        scan = _SentenceScan()
+
+        sentence_parts: List[str] = []
+        pending_text = ""
+        pending_whitespace = ""
+
+        for text_chunk in _iter_text_chunks(text_chunks, chunk_size):
+            raw_text = pending_whitespace + text_chunk
+            stripped_raw_text = raw_text.rstrip()
+            pending_whitespace = raw_text[len(stripped_raw_text) :]
+
+            if not stripped_raw_text:
+                continue
+
+            normalized_text = utext.normalize_spaces(stripped_raw_text, strip=False)
+
+            if pending_text or sentence_parts:
+                pending_text += normalized_text
+            else:
+                # Start of the text, which normalize_spaces would strip
+                pending_text = normalized_text.lstrip()
+
+            for start, end in _iter_sentence_spans(
+                text=pending_text,
+                stop_re=self._stop_re,
+                abbreviation_matcher=abbreviation_matcher,
+                min_chars=min_chars,
+                final=False,
+                scan=scan,
+            ):
+                if start < 0:
+                    sentence = "".join(sentence_parts) + pending_text[:end]
+                    sentence_parts = []
+                else:
+                    sentence = pending_text[start:end]
+
+                yield from self._split_sentence(sentence, split_inline_breaks)
+
+            context_start = abbreviation_matcher.context_start(
+                pending_text, max(scan.start, 0)
+            )
+
+            if context_start > 0:
+                sentence_parts.append(pending_text[max(scan.start, 0) : context_start])
+                pending_text = pending_text[context_start:]
+                scan.shift(context_start)
+
+        if scan.end > scan.start:
+            sentence = "".join(sentence_parts) + pending_text[max(scan.start, 0) :]
+
+            yield from self._split_sentence(sentence, split_inline_breaks)
+
+    def split_spans(
+        self,
+        text: str,
+        split_inline_breaks: bool = True,
+        min_chars: int = 5,
+        normalized: bool = False,
+    ) -> "SentenceSpans":
+
+        raw_text = utext.normalize_spaces(text, normalized=normalized)
+
+        offsets = array("I" if len(raw_text) < _MAX_UINT_OFFSET else "Q")
+
+        for start, end in _iter_sentence_spans(
+            text=raw_text,
+            stop_re=self._stop_re,
+            abbreviation_matcher=abbreviations.get_matcher(self.language),
+            min_chars=min_chars,
+        ):
+            span = _strip_span(raw_text, start, end)
+
+            if span is None:
+                continue
+
+            if split_inline_breaks:
+                sentence_spans = self._iter_inline_break_spans(raw_text, *span)
+            else:
+                sentence_spans = iter([span])
+
+            for sentence_start, sentence_end in sentence_spans:
+                # Same as remove_empty, sentences need more than 2 chars
+                if sentence_end - sentence_start > 2:
+                    offsets.append(sentence_start)
+                    offsets.append(sentence_end)
+
+        return SentenceSpans(raw_text, offsets)
+
+    def _split_sentence(
+        self,
+        sentence: str,
+        split_inline_breaks: bool = True,
+    ) -> List[str]:
+
+        sentence = sentence.strip()
+
+        if not sentence:
+            return []
+
+        if not split_inline_breaks:
+            return remove_empty([sentence])
+
+        return remove_empty(
+            [part.strip() for part in self._inline_breaks_re.split(sentence)]
+        )
 
-    raw_text = utext.normalize_spaces(text)
+    def _iter_inline_break_spans(
+        self,
+        text: str,
+        start: int,
+        end: int,
+    ) -> Iterator[Tuple[int, int]]:
 
-    sentences = []
+        # Break patterns are anchored to the sentence, so they have to be
+        # matched against the sentence itself and not the whole text.
+        sentence = text[start:end]
 
-    text_parts: List[str] = []
+        part_spans = []
+        part_start = 0
 
-    for raw_sentence in stop_re.split(raw_text):
+        for break_match in self._inline_breaks_re.finditer(sentence):
+            part_spans.append((part_start, break_match.start()))
+            part_spans += [
+                break_match.span(group)
+                for group in range(1, len(break_match.groups()) + 1)
+                if break_match.group(group) is not None
+            ]
 
-        sentence = "".join(text_parts)
+            part_start = break_match.end()
 
-        if raw_sentence and text_parts and len(sentence) >= min_chars:
-            if stop_re.match(text_parts[-1]) and not abbr_re.search(sentence):
-                sentences.append(sentence)
+        part_spans.append((part_start, len(sentence)))
 
-                text_parts = []
+        for part_start, part_end in part_spans:
+            span = _strip_span(text, start + part_start, start + part_end)
 
-        if raw_sentence:
-            text_parts.append(raw_sentence)
+            if span is not None:
+                yield span
 
-    if text_parts:
-        sentences.append("".join(text_parts))
 
-    sentences = [sen.strip() for sen in sentences if sen.strip()]
+class SentenceSpans(Sequence):
+    """Sentences stored as (start, end) offsets into the normalized text.
 
-    if split_inline_breaks:
-        sentences = split_inline_breaks_to_sentences(
-            sentences=sentences,
-            inline_breaks=inline_breaks,
-        )
+    Offsets are kept in a flat array and sentence strings are only created
+    when they are accessed.
+    """
+
+    __slots__ = ("text", "offsets")
+
+    def __init__(self, text: str, offsets: array):
+        self.text = text
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) // 2
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        start, end = self.span(index)
+
+        return self.text[start:end]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SentenceSpans):
+            return self.text == other.text and self.offsets == other.offsets
+
+        return list(self) == other
 
-    return remove_empty(sentences)
+    def __repr__(self) -> str:
+        return "SentenceSpans({!r})".format(list(self.spans()))
+
+    def span(self, index: int) -> Tuple[int, int]:
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("sentence index out of range")
+
+        return self.offsets[index * 2], self.offsets[index * 2 + 1]
+
+    def spans(self) -> Iterator[Tuple[int, int]]:
+        offsets = iter(self.offsets)
+        return zip(offsets, offsets)
+
+
+def get_segmenter(
+    language: str = "en",
+    stop_keys: Optional[List[str]] = None,
+    inline_breaks: Optional[List[str]] = None,
+) -> Segmenter:
+
+    if stop_keys is None:
+        stop_keys = config.STOP_KEYS
+
+    if inline_breaks is None:
+        inline_breaks = config.INLINE_BREAKS
+    else:
+        inline_breaks = list(inline_breaks) + config.INLINE_BREAKS
+
+    return _get_segmenter(language, tuple(stop_keys), tuple(inline_breaks))
+
+
+def segmenter_cache_info():
+    """Return hits, misses and size of the segmenter registry."""
+
+    return _get_segmenter.cache_info()
+
+
+@lru_cache(maxsize=256)
+def _get_segmenter(
+    language: str,
+    stop_keys: Tuple[str, ...],
+    inline_breaks: Tuple[str, ...],
+) -> Segmenter:
+
+    return Segmenter(
+        language=language,
+        stop_keys=stop_keys,
+        inline_breaks=inline_breaks,
+    )
 
 
 def merge(
-    sentences: list,
+    sentences: Iterable[str],
     stop_keys_ignore: Optional[List[str]] = None,
 ) -> List[str]:
 
+    return list(iter_merge(sentences, stop_keys_ignore))
+
+
+def iter_merge(
+    sentences: Iterable[str],
+    stop_keys_ignore: Optional[Union[List[str], str]] = None,
+) -> Iterator[str]:
+    """Join each sentence ending with an ignored stop key with the next one."""
+
     if stop_keys_ignore is None:
         stop_keys_ignore = config.STOP_KEYS_IGNORE
 
-    merged_sentences = []
+    if isinstance(stop_keys_ignore, str):
+        stop_keys_ignore = [stop_keys_ignore]
 
-    while sentences:
-        sentence = sentences.pop(0)
+    endswith_keys = tuple(stop_keys_ignore)
 
-        if sentences and utext.endswith_key(sentence, stop_keys_ignore):
-            next_sentence = sentences.pop(0)
+    sentences = iter(sentences)
 
-            sentence = "{} {}".format(sentence, next_sentence)
+    for sentence in sentences:
+        if sentence.endswith(endswith_keys):
+            next_sentence = next(sentences, _NO_SENTENCE)
 
-        merged_sentences.append(sentence)
+            if next_sentence is not _NO_SENTENCE:
+                sentence = "{} {}".format(sentence, next_sentence)
 
-    return merged_sentences
+        yield sentence
 
 
 def add_stop(
@@ -122,45 +660,63 @@ def lowercase(sentences: List[str]) -> List[str]:
 
 def replace_chars_by_keys(
     sentences: List[str],
-    replace_keys: list,
+    replace_keys: Union[list, utext.ReplacementTable],
+    normalized: bool = False,
 ) -> List[str]:
+    """Replace keys in sentences and normalize their spaces.
 
-    sentences = [
-        utext.replace_chars_by_keys(sentence, replace_keys) for sentence in sentences
-    ]
-    return [utext.normalize_spaces(sentence) for sentence in sentences]
+    When sentences are already ``normalized`` only the changed ones are
+    normalized again.
+    """
+
+    replacement_table = utext.get_replacement_table(replace_keys)
+
+    return _normalize_changed(
+        sentences,
+        [replacement_table.replace(sentence) for sentence in sentences],
+        normalized,
+    )
 
 
 def remove_chars_by_keys(
     sentences: List[str],
     remove_keys: list,
+    normalized: bool = False,
 ) -> List[str]:
 
-    sentences = [
-        utext.remove_chars_by_keys(sentence, remove_keys) for sentence in sentences
-    ]
-    return [utext.normalize_spaces(sentence) for sentence in sentences]
+    return _normalize_changed(
+        sentences,
+        [utext.remove_chars_by_keys(sentence, remove_keys) for sentence in sentences],
+        normalized,
+    )
 
 
 def split_inline_breaks_to_sentences(
-    sentences: list,
+    sentences: Iterable[str],
     inline_breaks: Optional[List[str]] = None,
-):
+) -> List[str]:
+
+    return list(iter_split_inline_breaks(sentences, inline_breaks))
+
+
+def iter_split_inline_breaks(
+    sentences: Iterable[str],
+    inline_breaks: Optional[List[str]] = None,
+) -> Iterator[str]:
+
     if inline_breaks is None:
         inline_breaks = config.INLINE_BREAKS
     else:
-        inline_breaks += config.INLINE_BREAKS
-
-    inline_breaks_re = u"{}".format("|".join(inline_breaks))
+        inline_breaks = list(inline_breaks) + config.INLINE_BREAKS
 
-    new_sentences: List[str] = []
+    inline_breaks_re = _get_inline_breaks_re(tuple(inline_breaks))
 
     for sentence in sentences:
-        new_sentences = new_sentences + re.split(inline_breaks_re, sentence)
+        for new_sentence in inline_breaks_re.split(sentence):
+            new_sentence = new_sentence.strip()
 
-    return [
-        new_sentence.strip() for new_sentence in new_sentences if new_sentence.strip()
-    ]
+            if new_sentence:
+                yield new_sentence
 
 
 def remove_empty(sentences: list) -> List[str]:
@@ -169,30 +725,30 @@ def remove_empty(sentences: list) -> List[str]:
 
 def allow_contains(
     sentences: List[str],
-    keys=Union[List[str], str],
+    keys: Union[List[str], str, utext.KeywordSet],
     case_sensitive: bool = False,
 ) -> List[str]:
 
-    return [
-        sentence
-        for sentence in sentences
-        if utext.contains(sentence, keys, case_sensitive)
-    ]
+    keyword_set = utext.get_keyword_set(keys, case_sensitive)
+
+    return [sentence for sentence in sentences if keyword_set.contains(sentence)]
 
 
 def from_allow_contains(
     sentences: List[str],
-    keys=Union[List[str], str],
+    keys: Union[List[str], str, utext.KeywordSet],
     case_sensitive: bool = False,
 ):
 
+    keyword_set = utext.get_keyword_set(keys, case_sensitive)
+
     allowed_sentences: List[str] = []
 
     for sentence in sentences:
         if allowed_sentences:
             allowed_sentences.append(sentence)
         else:
-            if utext.contains(sentence, keys, case_sensitive):
+            if keyword_set.contains(sentence):
                 allowed_sentences.append(sentence)
 
     return allowed_sentences
@@ -200,14 +756,16 @@ def from_allow_contains(
 
 def to_allow_contains(
     sentences: List[str],
-    keys=Union[List[str], str],
+    keys: Union[List[str], str, utext.KeywordSet],
     case_sensitive: bool = False,
 ):
 
+    keyword_set = utext.get_keyword_set(keys, case_sensitive)
+
     allowed_sentences = []
 
     for sentence in sentences:
-        if utext.contains(sentence, keys, case_sensitive):
+        if keyword_set.contains(sentence):
             break
 
         allowed_sentences.append(sentence)
@@ -217,15 +775,13 @@ def to_allow_contains(
 
 def deny_contains(
     sentences: List[str],
-    keys=Union[List[str], str],
+    keys: Union[List[str], str, utext.KeywordSet],
     case_sensitive: bool = False,
 ) -> List[str]:
 
-    return [
-        sentence
-        for sentence in sentences
-        if not utext.contains(sentence, keys, case_sensitive)
-    ]
+    keyword_set = utext.get_keyword_set(keys, case_sensitive)
+
+    return [sentence for sentence in sentences if not keyword_set.contains(sentence)]
 
 
 def to_text(
@@ -236,7 +792,175 @@ def to_text(
     return separator.join(sentences)
 
 
-def _get_abbr_re_pattern(language="en"):
-    abbr_list = getattr(abbreviations, language)
-    abbr_pattern = r"(?:{})\.\s*$".format(r"|[\s,\(]".join(abbr_list))
-    return re.compile(abbr_pattern, re.IGNORECASE)
+def _normalize_changed(
+    sentences: List[str],
+    changed_sentences: List[str],
+    normalized: bool = False,
+) -> List[str]:
+
+    return [
+        utext.normalize_spaces(
+            changed_sentence, normalized=normalized and changed_sentence == sentence
+        )
+        for sentence, changed_sentence in zip(sentences, changed_sentences)
+    ]
+
+
+def _split_text_chunk(
+    segmenter: Segmenter,
+    abbreviation_matcher: abbreviations.AbbreviationMatcher,
+    text: str,
+    split_inline_breaks: bool = True,
+    min_chars: int = 5,
+) -> List[str]:
+
+    sentences = []
+
+    for start, end in _iter_sentence_spans(
+        text=text,
+        stop_re=segmenter._stop_re,
+        abbreviation_matcher=abbreviation_matcher,
+        min_chars=min_chars,
+    ):
+        sentences += segmenter._split_sentence(text[start:end], split_inline_breaks)
+
+    return sentences
+
+
+@lru_cache(maxsize=256)
+def _get_inline_breaks_re(inline_breaks: Tuple[str, ...]) -> Pattern:
+    return re.compile("{}".format("|".join(inline_breaks)))
+
+
+class _SentenceScan:
+    """Where ``_iter_sentence_spans`` left off in a text that continues.
+
+    Offsets are relative to the scanned text, the start of the unfinished
+    sentence is negative once the text before it is dropped.
+    """
+
+    __slots__ = ("start", "end", "last_stop_end", "ends_with_stop")
+
+    def __init__(self):
+        self.start = 0
+        self.end = 0
+        self.last_stop_end = 0
+        self.ends_with_stop = False
+
+    def shift(self, offset: int) -> None:
+        self.start -= offset
+        self.end -= offset
+        self.last_stop_end -= offset
+
+
+def _iter_sentence_spans(
+    text: str,
+    stop_re: Pattern,
+    abbreviation_matcher: abbreviations.AbbreviationMatcher,
+    min_chars: int = 5,
+    final: bool = True,
+    scan: Optional[_SentenceScan] = None,
+) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) offsets of sentences in an already normalized text.
+
+    Text is consumed as alternating text and stop parts produced by
+    ``stop_re``. A sentence ends on a stop part once the next non-empty part
+    arrives, the sentence is at least ``min_chars`` long and it doesn't end
+    with an abbreviation. Only the sentence offsets are tracked, so each
+    check costs the same however long the sentence already is.
+
+    When ``final`` is False more text may follow, so the last (unfinished)
+    sentence isn't yielded. With ``scan`` the scan continues where it left
+    off in the same text, with more text appended to it since then.
+    """
+
+    start = end = 0
+
+    ends_with_stop = False
+
+    def is_sentence_end() -> bool:
+        if not ends_with_stop or end - start < min_chars or end <= start:
+            return False
+
+        # The text before the scanned one is never needed by abbreviations
+        return not abbreviation_matcher.endswith_abbreviation(text, max(start, 0), end)
+
+    last_stop_end = 0
+    scan_start = 0
+
+    if scan is not None:
+        start, end = scan.start, scan.end
+        last_stop_end, ends_with_stop = scan.last_stop_end, scan.ends_with_stop
+
+        # Text ended with a non whitespace char, only a stop starting with
+        # that char can continue into the appended text
+        scan_start = max(end - 1, 0)
+
+    for stop_match in stop_re.finditer(text, scan_start):
+        stop_start, stop_end = stop_match.span()
+
+        if stop_start > last_stop_end:
+            if is_sentence_end():
+                yield start, end
+
+                start = end
+
+            end = stop_start
+            ends_with_stop = False
+
+        if is_sentence_end():
+            yield start, end
+
+            start = end
+
+        end = last_stop_end = stop_end
+        ends_with_stop = True
+
+    if len(text) > last_stop_end:
+        if is_sentence_end():
+            yield start, end
+
+            start = end
+
+        end = len(text)
+        ends_with_stop = False
+
+    if scan is not None:
+        scan.start, scan.end = start, end
+        scan.last_stop_end, scan.ends_with_stop = last_stop_end, ends_with_stop
+
+    if final and end > start:
+        yield start, end
+
+
+def _strip_span(text: str, start: int, end: int) -> Optional[Tuple[int, int]]:
+    """Offsets of text[start:end].strip(), None when nothing is left."""
+
+    part = text[start:end]
+    stripped_part = part.lstrip()
+
+    if not stripped_part:
+        return None
+
+    start += len(part) - len(stripped_part)
+    end -= len(stripped_part) - len(stripped_part.rstrip())
+
+    return start, end
+
+
+def _iter_text_chunks(
+    text_chunks: Union[IO[str], Iterable[str]],
+    chunk_size: int = 65536,
+) -> Iterator[str]:
+
+    if isinstance(text_chunks, str):
+        yield text_chunks
+    elif hasattr(text_chunks, "read"):
+        text_chunk = text_chunks.read(chunk_size)
+
+        while text_chunk:
+            yield text_chunk
+
+            text_chunk = text_chunks.read(chunk_size)
+    else:
+        yield from text_chunks
@@ -1,8 +1,12 @@
 import re
-from typing import Any, List, Optional, Tuple, Union
+import unicodedata
+from collections import deque
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Pattern, Sequence, Tuple, Union
 
-from ftfy import fix_text
+import ftfy
 from number_parser import parse
+from number_parser.parser import RE_BUG_LANGUAGES, LanguageData
 from pyquery import PyQuery
 
 from easytxt import config
@@ -12,15 +16,25 @@ __all__ = (
     "capitalize_paragraph",
     "replace_chars_by_key",
     "replace_chars_by_keys",
+    "ReplacementTable",
+    "get_replacement_table",
     "remove_chars_by_keys",
     "has_stop_key",
     "endswith_key",
     "add_stop_key",
     "remove_stop_key",
     "contains",
+    "KeywordSet",
+    "get_keyword_set",
     "normalize_spaces",
     "normalize_breaks",
     "normalize",
+    "normalize_texts",
+    "fix_text",
+    "fix_texts",
+    "enable_fix_text_cache",
+    "disable_fix_text_cache",
+    "fix_text_cache_info",
     "take",
     "skip",
     "remove_inline_breaks",
@@ -30,9 +44,50 @@ __all__ = (
     "split_by_keys",
     "to_str",
     "to_numeric_from_text_num",
+    "to_numeric_from_text_nums",
     "to_list",
 )
 
+# Texts without these chars are never changed by ftfy: ascii text without
+# html entities ("&") and control chars other than tab, new line and form feed
+_FIX_TEXT_NEEDED_RE = re.compile(r"[^\t\n\x0c\x20-\x25\x27-\x7e]")
+
+_MULTIPLE_SPACES_RE = re.compile(r"\s\s+")
+
+# Longer texts are fixed without the cache, to keep its memory use bounded
+FIX_TEXT_CACHE_MAX_CHARS = 10_000
+
+_fix_text_cache: Optional[Callable[[str], str]] = None
+
+# Ordinal words that number_parser reads as the cardinal words, as listed in
+# number_parser.parser of the number-parser versions pinned in setup.py
+_TEXT_NUM_ORDINALS = (
+    ("first", "one"),
+    ("second", "two"),
+    ("third", "three"),
+    ("fifth", "five"),
+    ("eighth", "eight"),
+    ("ninth", "nine"),
+    ("twelfth", "twelve"),
+)
+
+_WORDS_RE = re.compile(r"\w+")
+
+# Below this many plain keys, substring checks are faster than an automaton
+_AUTOMATON_MIN_KEYS = 100
+
+# Regex special chars, keys without them match only themselves
+_REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+_GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Non ascii chars that match ascii letters when case is ignored
+_IGNORECASE_CHARS = {"i": "\u0130\u0131", "k": "\u212a", "s": "\u017f"}
+
+_IGNORECASE_ASCII_FOLDS = str.maketrans(
+    {char: letter for letter, chars in _IGNORECASE_CHARS.items() for char in chars}
+)
+
 
 def capitalize(text: str) -> str:
     return text[0].upper() + text[1:]
@@ -52,32 +107,229 @@ def replace_chars_by_key(
     replace_value: str,
 ) -> str:
 
-    if re.search(replace_key, text, flags=re.IGNORECASE):
-        text = re.sub(
-            replace_key,
-            replace_value,
-            text,
-            flags=re.IGNORECASE,
-        )
+    if _is_literal_key(replace_key):
+        if replace_key.lower() not in _fold_ignorecase(text):
+            return text
+
+        return _compile_re(replace_key, re.IGNORECASE).sub(replace_value, text)
+
+    pattern = _compile_re(replace_key, re.IGNORECASE)
+
+    if pattern.search(text):
+        text = pattern.sub(replace_value, text)
 
     return text
 
 
 def replace_chars_by_keys(
     text: str,
-    replace_keys: List[Tuple[str, str]],
+    replace_keys: Union[List[Tuple[str, str]], "ReplacementTable"],
 ) -> str:
 
-    for replace_key_tuple in replace_keys:
-        replace_key, replace_value = replace_key_tuple
+    return get_replacement_table(replace_keys).replace(text)
 
-        text = replace_chars_by_key(
-            text=text,
-            replace_key=replace_key,
-            replace_value=replace_value,
-        )
 
-    return text
+class ReplacementTable:
+    """Compiled list of (key, value) replacements applied to a text in order.
+
+    The result is always the same as calling ``replace_chars_by_key`` for
+    each pair in turn, but texts are not scanned once per key. Consecutive
+    single char keys are replaced together with ``str.translate``. For runs
+    of plain ascii words, one scan with an alternation of all keys finds
+    which keys are in the text and only those are replaced. Other keys are
+    replaced one by one, after a joined pattern of them found a match.
+    """
+
+    def __init__(self, replace_keys: Sequence[Tuple[str, str]]):
+        self.replace_keys = [
+            (replace_key, replace_value) for replace_key, replace_value in replace_keys
+        ]
+
+        self._steps: List[Union[Dict[int, str], _KeysReplacement]] = []
+
+        translation: Dict[int, str] = {}
+        translation_values = ""
+        replace_keys_run: List[Tuple[str, str]] = []
+
+        for replace_key, replace_value in self.replace_keys:
+            chars = _get_translated_chars(replace_key, replace_value)
+
+            if chars is None:
+                if translation:
+                    self._steps.append(translation)
+                    translation, translation_values = {}, ""
+
+                replace_keys_run.append((replace_key, replace_value))
+                continue
+
+            if replace_keys_run:
+                self._steps.append(_KeysReplacement(replace_keys_run))
+                replace_keys_run = []
+
+            # A char put in by an earlier key would be replaced again
+            if any(char in translation_values for char in chars):
+                self._steps.append(translation)
+                translation, translation_values = {}, ""
+
+            for char in chars:
+                translation.setdefault(ord(char), replace_value)
+
+            translation_values += replace_value
+
+        if translation:
+            self._steps.append(translation)
+
+        if replace_keys_run:
+            self._steps.append(_KeysReplacement(replace_keys_run))
+
+    def __len__(self) -> int:
+        return len(self.replace_keys)
+
+    def __repr__(self) -> str:
+        return "ReplacementTable({!r})".format(self.replace_keys)
+
+    def replace(self, text: str) -> str:
+        for step in self._steps:
+            if isinstance(step, dict):
+                text = text.translate(step)
+            else:
+                text = step.replace(text)
+
+        return text
+
+
+class _KeysReplacement:
+    """Replaces keys which aren't single chars, see ``ReplacementTable``."""
+
+    def __init__(self, replace_keys: List[Tuple[str, str]]):
+        self.replace_keys = replace_keys
+
+        self._patterns = [
+            (_compile_re(replace_key, re.IGNORECASE), replace_value)
+            for replace_key, replace_value in self.replace_keys
+        ]
+
+        self._keys_re: Optional[Pattern] = None
+        self._any_key_re: Optional[Pattern] = None
+
+        if all(_is_literal_key(replace_key) for replace_key, _ in self.replace_keys):
+            self._compile_literal_keys()
+        else:
+            self._any_key_re = _compile_any_key_re(
+                [replace_key for replace_key, _ in self.replace_keys]
+            )
+
+    def replace(self, text: str) -> str:
+        if self._keys_re is not None:
+            return self._replace_literal_keys(text)
+
+        if self._any_key_re is not None and not self._any_key_re.search(text):
+            return text
+
+        for pattern, replace_value in self._patterns:
+            text = pattern.sub(replace_value, text)
+
+        return text
+
+    def _compile_literal_keys(self) -> None:
+        keys = [replace_key.lower() for replace_key, _ in self.replace_keys]
+
+        self._keys_re = _compile_words_re(keys)
+
+        self._key_indexes: Dict[str, int] = {}
+
+        for index, key in enumerate(keys):
+            self._key_indexes.setdefault(key, index)
+
+        # Keys that can match at the same position as a key. Only one of
+        # them is found there by the scan.
+        self._same_start_keys = [
+            [
+                other_index
+                for other_index, other_key in enumerate(keys)
+                if other_index != index
+                and (other_key.startswith(key) or key.startswith(other_key))
+            ]
+            for index, key in enumerate(keys)
+        ]
+
+        # Whether a value could make a later key match where it didn't
+        self._creates_keys = [
+            "\\" in replace_value
+            or any(
+                _can_overlap(_fold_ignorecase(replace_value), other_key)
+                for other_key in keys[index + 1 :]
+            )
+            for index, (_, replace_value) in enumerate(self.replace_keys)
+        ]
+
+    def _replace_literal_keys(self, text: str) -> str:
+        key_indexes = self._find_key_indexes(text, -1)
+
+        while key_indexes:
+            index = min(key_indexes)
+            key_indexes.discard(index)
+
+            pattern, replace_value = self._patterns[index]
+            text, count = pattern.subn(replace_value, text)
+
+            if count and self._creates_keys[index]:
+                key_indexes = self._find_key_indexes(text, index)
+
+        return text
+
+    def _find_key_indexes(self, text: str, after_index: int) -> set:
+        """Indexes of keys after ``after_index`` that may match in text.
+
+        Text is folded to lower case ascii so that keys can be found without
+        ignoring case, which is much faster. The scan restarts right after
+        the start of each found key so that overlapping keys are found too.
+        """
+
+        if self._keys_re is None:
+            return set()
+
+        folded_text = _fold_ignorecase(text)
+        search = self._keys_re.search
+
+        key_indexes = set()
+
+        key_match = search(folded_text)
+
+        while key_match:
+            index = self._key_indexes[key_match.group()]
+
+            for other_index in [index] + self._same_start_keys[index]:
+                if other_index > after_index:
+                    key_indexes.add(other_index)
+
+            key_match = search(folded_text, key_match.start() + 1)
+
+        return key_indexes
+
+
+def get_replacement_table(
+    replace_keys: Union[List[Tuple[str, str]], ReplacementTable],
+) -> ReplacementTable:
+    """Return a ``ReplacementTable`` for replace keys, compiled only once."""
+
+    if isinstance(replace_keys, ReplacementTable):
+        return replace_keys
+
+    return _get_replacement_table(tuple(tuple(pair) for pair in replace_keys))
+
+
+@lru_cache(maxsize=256)
+def _get_removal_table(remove_keys: Tuple[str, ...]) -> ReplacementTable:
+    return ReplacementTable([(remove_key, "") for remove_key in remove_keys])
+
+
+@lru_cache(maxsize=256)
+def _get_replacement_table(
+    replace_keys: Tuple[Tuple[str, str], ...],
+) -> ReplacementTable:
+
+    return ReplacementTable(replace_keys)
 
 
 def remove_chars_by_keys(
@@ -85,17 +337,13 @@ def remove_chars_by_keys(
     remove_keys: List[str],
 ):
 
-    text_replacements = [(rc, "") for rc in remove_keys]
-
-    return replace_chars_by_keys(text, text_replacements)
+    return _get_removal_table(tuple(remove_keys)).replace(text)
 
 
 def has_stop_key(text: str) -> bool:
     text = text.strip()
 
-    stop_keys = config.STOP_KEYS + config.STOP_KEYS_IGNORE
-
-    return endswith_key(text, stop_keys)
+    return text.endswith(tuple(config.STOP_KEYS + config.STOP_KEYS_IGNORE))
 
 
 def endswith_key(
@@ -104,9 +352,9 @@ def endswith_key(
 ) -> bool:
 
     if isinstance(endswith_keys, str):
-        endswith_keys = [endswith_keys]
+        return text.endswith(endswith_keys)
 
-    return any(text.endswith(stop_key) for stop_key in endswith_keys)
+    return text.endswith(tuple(endswith_keys))
 
 
 def add_stop_key(
@@ -143,25 +391,181 @@ def remove_stop_key(
 
 def contains(
     text: str,
-    keys: Union[List[str], str],
+    keys: Union[List[str], str, "KeywordSet"],
     case_sensitive: bool = False,
 ) -> bool:
 
+    return get_keyword_set(keys, case_sensitive).contains(text)
+
+
+class KeywordSet:
+    """Keys that are all looked up in a text at once.
+
+    Gives the same result as searching for each key with ``re.search``.
+    Keys that match only themselves are looked up as substrings, or in one
+    pass over the text by an Aho-Corasick automaton when there are many of
+    them. The rest are joined into one pattern. Ascii keys are matched case
+    insensitively against a case folded text.
+    """
+
+    def __init__(
+        self,
+        keys: Union[List[str], str],
+        case_sensitive: bool = False,
+    ):
+
+        if isinstance(keys, str):
+            keys = [keys]
+
+        self.keys = list(keys)
+        self.case_sensitive = case_sensitive
+
+        literal_keys = []
+        regex_keys = []
+
+        for key in self.keys:
+            if _is_literal_key(key, case_sensitive):
+                literal_keys.append(key if case_sensitive else key.lower())
+            else:
+                regex_keys.append(key)
+
+        self._literal_keys = literal_keys
+        self._use_automaton = len(literal_keys) >= _AUTOMATON_MIN_KEYS
+
+        if self._use_automaton:
+            self._build_automaton(literal_keys)
+
+        ignore_case = 0 if case_sensitive else re.IGNORECASE
+
+        any_key_re = _compile_any_key_re(regex_keys, ignore_case)
+
+        if any_key_re is not None:
+            self._patterns = [any_key_re]
+        else:
+            self._patterns = [_compile_re(key, ignore_case) for key in regex_keys]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __repr__(self) -> str:
+        return "KeywordSet({!r}, case_sensitive={!r})".format(
+            self.keys, self.case_sensitive
+        )
+
+    def contains(self, text: str) -> bool:
+        if self._literal_keys:
+            folded_text = text if self.case_sensitive else _fold_ignorecase(text)
+
+            if self._use_automaton:
+                if self._contains_literal_key(folded_text):
+                    return True
+            else:
+                for key in self._literal_keys:
+                    if key in folded_text:
+                        return True
+
+        for pattern in self._patterns:
+            if pattern.search(text):
+                return True
+
+        return False
+
+    def _build_automaton(self, keys: List[str]) -> None:
+        # State transitions, fallback states on a mismatch and whether a
+        # key ends in a state (or in any of its fallback states)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail = [0]
+        self._ends = [False]
+
+        for key in keys:
+            state = 0
+
+            for char in key:
+                next_state = self._goto[state].get(char)
+
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._ends.append(False)
+                    self._goto[state][char] = next_state
+
+                state = next_state
+
+            self._ends[state] = True
+
+        states = deque(self._goto[0].values())
+
+        while states:
+            state = states.popleft()
+
+            for char, next_state in self._goto[state].items():
+                states.append(next_state)
+
+                fail_state = self._fail[state]
+
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+
+                self._fail[next_state] = self._goto[fail_state].get(char, 0)
+
+                if self._ends[self._fail[next_state]]:
+                    self._ends[next_state] = True
+
+    def _contains_literal_key(self, text: str) -> bool:
+        goto = self._goto
+        fail = self._fail
+        ends = self._ends
+
+        state = 0
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+
+            state = goto[state].get(char, 0)
+
+            if ends[state]:
+                return True
+
+        return False
+
+
+def get_keyword_set(
+    keys: Union[List[str], str, KeywordSet],
+    case_sensitive: bool = False,
+) -> KeywordSet:
+    """Return a ``KeywordSet`` for keys, compiled only once."""
+
+    if isinstance(keys, KeywordSet):
+        return keys
+
     if isinstance(keys, str):
-        keys = [keys]
+        return _get_keyword_set((keys,), case_sensitive)
+
+    return _get_keyword_set(tuple(keys), case_sensitive)
+
+
+@lru_cache(maxsize=256)
+def _get_keyword_set(keys: Tuple[str, ...], case_sensitive: bool) -> KeywordSet:
+    return KeywordSet(list(keys), case_sensitive)
+
 
-    ignore_case = 0 if case_sensitive else re.IGNORECASE
+def normalize_spaces(text: str, strip: bool = True, normalized: bool = False) -> str:
+    """Collapse whitespace and remove spaces before dots.
 
-    for key in keys:
-        if re.search(key, text, ignore_case):
-            return True
+    ``normalized`` tells that text already had this normalization, so it is
+    returned as is (and checked when ``config.AUDIT_NORMALIZATION`` is set).
+    """
 
-    return False
+    if normalized:
+        if config.AUDIT_NORMALIZATION:
+            _audit_normalization(text, normalize_spaces(text, strip))
 
+        return text
 
-def normalize_spaces(text: str) -> str:
-    text = re.sub(r"\s\s+", " ", text)
-    return text.replace(" .", ".").strip()
+    text = _MULTIPLE_SPACES_RE.sub(" ", text).replace(" .", ".")
+    return text.strip() if strip else text
 
 
 def normalize_breaks(
@@ -176,7 +580,7 @@ def normalize_breaks(
             continue
 
         if append_stops and not has_stop_key(raw_sentence):
-            raw_sentence = add_stop_key(raw_sentence)
+            raw_sentence = raw_sentence.strip() + "."
 
         sentences.append(raw_sentence)
 
@@ -206,6 +610,73 @@ def normalize(
     return text.replace(":.", ":").strip()
 
 
+def normalize_texts(texts: List[str], fix_spaces: bool = True) -> List[str]:
+    """Normalize many texts as ``normalize`` does, fixing each distinct one once."""
+
+    normalized_texts = []
+
+    for text in fix_texts([to_str(text) for text in texts]):
+        if fix_spaces:
+            text = normalize_spaces(text)
+
+        normalized_texts.append(text.replace(":.", ":").strip())
+
+    return normalized_texts
+
+
+def fix_text(text: str) -> str:
+    """Fix bad encoding and html entities with ftfy, when text can have any."""
+
+    if not _FIX_TEXT_NEEDED_RE.search(text):
+        return text
+
+    fix_text_cache = _fix_text_cache
+
+    if fix_text_cache is not None and len(text) <= FIX_TEXT_CACHE_MAX_CHARS:
+        return fix_text_cache(text)
+
+    return ftfy.fix_text(text)
+
+
+def fix_texts(texts: List[str]) -> List[str]:
+    """Fix many texts with the same result as calling ``fix_text`` on each.
+
+    Texts of one document, like menu items and labels, often repeat, so each
+    distinct text is fixed only once.
+    """
+
+    fixed_texts: Dict[str, str] = {}
+
+    for text in texts:
+        if text not in fixed_texts:
+            fixed_texts[text] = fix_text(text)
+
+    return [fixed_texts[text] for text in texts]
+
+
+def enable_fix_text_cache(maxsize: int = 4096) -> None:
+    """Keep up to ``maxsize`` recent ``fix_text`` results for repeated texts."""
+
+    global _fix_text_cache
+
+    _fix_text_cache = lru_cache(maxsize=maxsize)(ftfy.fix_text)
+
+
+def disable_fix_text_cache() -> None:
+    global _fix_text_cache
+
+    _fix_text_cache = None
+
+
+def fix_text_cache_info():
+    """Return hits, misses and size of the fix_text cache, None if disabled."""
+
+    if _fix_text_cache is None:
+        return None
+
+    return _fix_text_cache.cache_info()
+
+
 def take(
     text: str,
     limit: int,
@@ -296,9 +767,14 @@ def split_by_key(
     case_sensitive: bool = False,
 ) -> str:
 
-    ignore_case = 0 if case_sensitive else re.IGNORECASE
+    # The flag is passed as maxsplit, so keys are always case sensitive and
+    # text is split at most twice unless case_sensitive is set.
+    maxsplit = 0 if case_sensitive else re.IGNORECASE
 
-    return re.split(split_key, text, ignore_case)[split_index]
+    if _is_literal_key(split_key, case_sensitive=True):
+        return text.split(split_key, maxsplit or -1)[split_index]
+
+    return _compile_re(split_key).split(text, maxsplit)[split_index]
 
 
 def split_by_keys(
@@ -344,7 +820,36 @@ def to_numeric_from_text_num(
     text: str,
     language="en",
 ) -> str:
-    return parse(text, language=language)
+    """Convert number words to numbers.
+
+    Texts without number words of the language are returned as number_parser
+    would return them, without parsing, and recent conversions are cached.
+    """
+
+    if language is None:
+        return parse(text, language=language)
+
+    # Raises the same error as number_parser for unsupported languages
+    _get_text_num_words(language)
+
+    text = text.replace("\xad", "")
+
+    if language in RE_BUG_LANGUAGES:
+        words = text.split()
+    else:
+        words = _WORDS_RE.findall(text)
+
+    if not any(_is_text_num_word(word, language) for word in words):
+        return text.strip()
+
+    return _parse_text_num(text, language)
+
+
+def to_numeric_from_text_nums(texts: List[str], language="en") -> List[str]:
+    """Convert number words to numbers in many texts, as
+    ``to_numeric_from_text_num`` does for each."""
+
+    return [to_numeric_from_text_num(text, language=language) for text in texts]
 
 
 def to_list(
@@ -379,3 +884,177 @@ def to_list(
                 return multiple_values
 
     return [value]
+
+
+def _audit_normalization(text: str, normalized_text: str) -> None:
+    if text != normalized_text:
+        raise AssertionError(
+            "Skipped normalization would change {!r} to {!r}".format(
+                text, normalized_text
+            )
+        )
+
+
+@lru_cache(maxsize=4096)
+def _parse_text_num(text: str, language: str) -> str:
+    return parse(text, language=language)
+
+
+@lru_cache(maxsize=None)
+def _get_text_num_words(language: str) -> Dict[str, Any]:
+    return LanguageData(language).all_numbers
+
+
+@lru_cache(maxsize=65536)
+def _is_text_num_word(word: str, language: str) -> bool:
+    """Check a word the way number_parser finds cardinal and ordinal words."""
+
+    text_num_words = _get_text_num_words(language)
+
+    word = "".join(
+        char
+        for char in unicodedata.normalize("NFD", word.lower())
+        if unicodedata.category(char) != "Mn"
+    )
+
+    if word in text_num_words:
+        return True
+
+    for ordinal, cardinal in _TEXT_NUM_ORDINALS:
+        word = word.replace(ordinal, cardinal)
+
+    return (
+        re.sub(r"ieth$", "y", word) in text_num_words
+        or re.sub(r"th$", "", word) in text_num_words
+    )
+
+
+@lru_cache(maxsize=1024)
+def _compile_re(pattern: str, flags: int = 0) -> Pattern:
+    """Compile a pattern, keeping recently used patterns of all modules."""
+
+    return re.compile(pattern, flags)
+
+
+def _compile_any_key_re(
+    keys: List[str],
+    flags: int = re.IGNORECASE,
+) -> Optional[Pattern]:
+    """Pattern that matches where any of the keys matches, if one can be made.
+
+    Group numbers shift when patterns are joined, so keys that refer to
+    groups can't be combined.
+    """
+
+    if not keys or any(_GROUP_REFERENCE_RE.search(key) for key in keys):
+        return None
+
+    try:
+        return re.compile("|".join("(?:{})".format(key) for key in keys), flags=flags)
+    except re.error:
+        return None
+
+
+def _compile_words_re(words: List[str]) -> Pattern:
+    """Pattern matching any of the words, with common prefixes merged.
+
+    Alternatives are tried one by one at each position, so a trie shaped
+    pattern is much faster than a plain alternation of many words.
+    """
+
+    trie: dict = {}
+
+    for word in words:
+        node = trie
+
+        for char in word:
+            node = node.setdefault(char, {})
+
+        node[""] = True
+
+    def to_pattern(node: dict) -> str:
+        branches = [
+            re.escape(char) + to_pattern(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+
+        if not branches:
+            return ""
+
+        pattern = "(?:{})".format("|".join(branches))
+
+        return pattern + "?" if "" in node else pattern
+
+    return re.compile(to_pattern(trie))
+
+
+@lru_cache(maxsize=1024)
+def _get_translated_chars(replace_key: str, replace_value: str) -> Optional[str]:
+    """Chars that a single char key replaces, None for other keys.
+
+    A single char is also given by escaping a regex special char. Keys are
+    matched ignoring case, so each case of an ascii letter is included.
+    Other cased chars are left to the regex engine.
+    """
+
+    if "\\" in replace_value:
+        return None
+
+    if len(replace_key) == 2 and replace_key[0] == "\\":
+        char = replace_key[1]
+
+        if char not in _REGEX_SPECIAL_CHARS:
+            return None
+    elif len(replace_key) == 1 and replace_key not in _REGEX_SPECIAL_CHARS:
+        char = replace_key
+    else:
+        return None
+
+    if char.isascii():
+        if char.isalpha():
+            lower_char = char.lower()
+            return (
+                lower_char + lower_char.upper() + _IGNORECASE_CHARS.get(lower_char, "")
+            )
+
+        return char
+
+    if char.lower() == char == char.upper():
+        return char
+
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _is_literal_key(key: str, case_sensitive: bool = False) -> bool:
+    """Check if key matches only itself (ignoring case for ascii keys)."""
+
+    if not key or _REGEX_SPECIAL_CHARS.intersection(key):
+        return False
+
+    return case_sensitive or key.isascii()
+
+
+def _fold_ignorecase(text: str) -> str:
+    if text.isascii():
+        return text.lower()
+
+    # Other non ascii chars can't match ascii keys, so they are replaced
+    # with a char which isn't in any key
+    return "".join(
+        char if char.isascii() else "\uffff"
+        for char in text.translate(_IGNORECASE_ASCII_FOLDS).lower()
+    )
+
+
+def _can_overlap(text: str, key: str) -> bool:
+    """Check if a match of key can include any part of text or border it."""
+
+    if text in key or key in text:
+        return True
+
+    return any(
+        text.endswith(key[:size]) or key.endswith(text[:size])
+        for size in range(1, min(len(text), len(key)))
+    )
@@ -13,6 +13,6 @@ setup(
     install_requires=[
         'ftfy',
         'pyquery',
-        'number-parser'
+        'number-parser>=0.3.2,<0.4'
     ]
 )
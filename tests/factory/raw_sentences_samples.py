@@ -5,4 +5,13 @@ english = [
     ),
     ("* camera * notebook * photo", ["camera", "notebook", "photo"]),
     ("- camera - notebook - photo", ["camera", "notebook", "photo"]),
+    (
+        "Cable No. 5 incl. adapter, charger etc. and Fig. 3 inside. Done! "
+        "Written by Dr. Adams, Ph.D. in 2020.",
+        [
+            "Cable No. 5 incl. adapter, charger etc. and Fig. 3 inside.",
+            "Done!",
+            "Written by Dr. Adams, Ph.D. in 2020.",
+        ],
+    ),
 ]
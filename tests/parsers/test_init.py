@@ -1,7 +1,13 @@
+import pickle
+import re
+
 import pytest
 from pyquery import PyQuery
 
-from easytxt.parsers import parse_string
+from easytxt import parsers
+from easytxt import text as utext
+from easytxt.parsers import StringParser, parse_string, parse_strings
+from easytxt.text import ReplacementTable
 from tests.factory import string_samples
 
 
@@ -48,6 +54,9 @@ def test_parse_string_replace_keys():
     )
     assert parsed_string == "Easybook Air 13"
 
+    replace_keys = ReplacementTable([("pro", "Air"), ("15", "13")])
+    assert parse_string(test_text, replace_keys=replace_keys) == "Easybook Air 13"
+
 
 def test_parse_string_remove_keys():
     test_text = "Easybook Pro 15"
@@ -135,3 +144,134 @@ def test_parse_string_text_num_to_numeric():
 def test_parse_string_add_stop(add_stop, test_data, result):
     parsed_string = parse_string(raw_text=test_data, add_stop=add_stop)
     assert parsed_string == result
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"normalize": False, "fix_spaces": False},
+        {"replace_keys": [("pro", "Max")], "remove_keys": ["_"], "title": True},
+        {"split_keys": [("-", -1), "_"], "add_stop": "!"},
+        {"split_key": "[0-9]", "take": 4, "uppercase": True},
+        {"text_num_to_numeric": True, "skip": 2, "lowercase": True},
+        {"escape_new_lines": False, "new_line_replacement": "|"},
+    ],
+)
+@pytest.mark.parametrize(
+    "test_data",
+    ["easybook-pro_13", " two\nthousand  and three ", 15, None, "Caf&eacute; :."],
+)
+def test_string_parser(options, test_data):
+    string_parser = StringParser(**options)
+
+    assert string_parser(test_data) == parse_string(test_data, **options)
+
+
+def test_string_parser_pickle():
+    string_parser = StringParser(replace_keys=[("pro", "Max")], split_key=("-", -1))
+    unpickled_string_parser = pickle.loads(pickle.dumps(string_parser))
+
+    assert unpickled_string_parser.options == string_parser.options
+    assert unpickled_string_parser("easybook-pro_13") == "Max_13"
+
+
+@pytest.mark.parametrize(
+    "options, error",
+    [
+        ({"split_key": "[0-9"}, re.error),
+        ({"split_keys": [("-", 0, 1)]}, ValueError),
+        ({"text_num_to_numeric": True, "language": "xx"}, ValueError),
+    ],
+)
+def test_string_parser_invalid_options(options, error):
+    with pytest.raises(error):
+        StringParser(**options)
+
+
+def test_parse_string_reuses_string_parser():
+    split_keys = ["-"]
+
+    assert parse_string("Easybook-Pro_15", split_keys=split_keys) == "Easybook"
+
+    split_keys[0] = "_"
+
+    assert parse_string("Easybook-Pro_15", split_keys=split_keys) == "Easybook-Pro"
+    assert parse_string("Easybook-Pro_15", split_keys=["-"]) == "Easybook"
+    assert parse_string("Easybook-Pro_15", split_key=("_", 1)) == "15"
+
+    with pytest.raises(re.error):
+        parse_string("Easybook", split_key="[0-9")
+
+
+def test_parse_strings():
+    test_data = ["Easybook-Pro ", 15, None, "Easybook-Pro ", "Easybook-Air"]
+    options = {"split_key": "-", "add_stop": True}
+
+    assert parse_strings(test_data, **options) == [
+        parse_string(test_value, **options) for test_value in test_data
+    ]
+
+
+def test_parse_strings_distinct_values(monkeypatch):
+    normalized_texts = []
+
+    def normalize(text, *args, **kwargs):
+        normalized_texts.append(text)
+        return text
+
+    monkeypatch.setattr(utext, "normalize", normalize)
+
+    parse_strings(["Easybook", "Easybook", 15, "15", None, ""])
+
+    assert normalized_texts == ["Easybook", "15", ""]
+
+
+def test_parse_strings_as_array():
+    numpy = pytest.importorskip("numpy")
+
+    parsed_array = parse_strings(["Easybook ", "Pro"], as_array=True)
+
+    assert isinstance(parsed_array, numpy.ndarray)
+    assert parsed_array.dtype == object
+    assert parsed_array.tolist() == ["Easybook", "Pro"]
+
+
+def test_parse_string_cache():
+    assert parsers.parse_string_cache_info() is None
+
+    parsers.enable_parse_string_cache(maxsize=2)
+
+    try:
+        string_parser = StringParser(split_key="-")
+
+        assert parse_string("Easybook-Pro", split_key="-") == "Easybook"
+        assert string_parser("Easybook-Pro") == "Easybook"
+        assert parse_string("Easybook-Pro", add_stop=True) == "Easybook-Pro."
+        assert parse_string("Easybook-Pro", add_stop=1) == "Easybook-Pro1"
+        assert string_parser(15) == "15"
+
+        cache_info = parsers.parse_string_cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.misses == 4
+        assert cache_info.evictions == 2
+        assert cache_info.size == 2
+        assert 0 < cache_info.bytes <= cache_info.max_bytes
+    finally:
+        parsers.disable_parse_string_cache()
+
+    assert parsers.parse_string_cache_info() is None
+
+
+def test_parse_string_cache_max_bytes():
+    parsers.enable_parse_string_cache(max_bytes=1000)
+
+    try:
+        assert parse_string("Easybook " * 100) == ("Easybook " * 100).strip()
+        assert parse_string("Easybook Pro") == "Easybook Pro"
+
+        cache_info = parsers.parse_string_cache_info()
+        assert cache_info.size == 1
+        assert cache_info.bytes < 1000
+    finally:
+        parsers.disable_parse_string_cache()
@@ -1,4 +1,5 @@
 import pytest
+from pyquery import PyQuery
 
 from easytxt import parse_table
 from tests.factory import table_samples
@@ -78,6 +79,22 @@ def test_parse_table_text():
     assert table_rows.text == expected_results
 
 
+@pytest.mark.parametrize(
+    "table_data",
+    [
+        PyQuery(table_samples.table_with_header),
+        PyQuery(table_samples.table_with_header)[0],
+        PyQuery(
+            "<div><p>Some text</p>{}</div>".format(table_samples.table_with_header)
+        )("table")[0],
+    ],
+)
+def test_parse_table_parsed_html(table_data):
+    table_rows = parse_table(table_data)
+
+    assert list(table_rows) == list(parse_table(table_samples.table_with_header))
+
+
 def test_parse_table_get_headers():
     table_rows = parse_table(table_samples.table_with_header)
 
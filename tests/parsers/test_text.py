@@ -1,7 +1,8 @@
 import pytest
 from pyquery import PyQuery
 
-from easytxt import parse_text
+from easytxt import config, parse_text, sentences
+from easytxt.text import KeywordSet, ReplacementTable
 from tests.factory import features_samples, sentences_samples, table_samples
 
 features_test_text = "- color: Black - material: Aluminium"
@@ -23,6 +24,14 @@ def test_parse_text_to_sentences_with_pyquery(test_data, result):
     assert parse_text(PyQuery(test_data)).sentences == result
 
 
+@pytest.mark.parametrize("test_data, result", sentences_samples.english)
+def test_parse_text_to_sentences_audit_normalization(monkeypatch, test_data, result):
+    monkeypatch.setattr(config, "AUDIT_NORMALIZATION", True)
+
+    assert parse_text(test_data).sentences == result
+    assert parse_text(test_data, remove_keys=["qqq"]).sentences == result
+
+
 @pytest.mark.parametrize("test_data, result", sentences_samples.english)
 def test_parse_text_to_text(test_data, result):
     assert parse_text(test_data).text == " ".join(result)
@@ -181,6 +190,17 @@ def test_parse_text_case_sensitive_deny(test_data, cdeny, result):
     assert tp.sentences == result
 
 
+def test_parse_text_keyword_set():
+    deny = KeywordSet(["first", "Second", "Thir"], case_sensitive=True)
+    assert parse_text(test_text_sentences, deny=deny).sentences == ["First sentence!"]
+
+    allow = KeywordSet(["SECOND", "third"])
+    assert parse_text(test_text_sentences, allow=allow).sentences == [
+        "Second sentence.",
+        "Third.",
+    ]
+
+
 def test_parse_text_capitalize_false():
     tp = parse_text(test_text_sentences, capitalize=False)
     assert tp.text == "first sentence! second sentence. Third."
@@ -214,6 +234,12 @@ def test_parse_text_replace_keys():
     assert tp.text == "First sentence? Second sentence. Third sentence."
 
 
+def test_parse_text_replacement_table():
+    replace_keys = ReplacementTable([("third", "Third sentence"), ("ence!", "ence?")])
+    tp = parse_text(test_text_sentences, replace_keys=replace_keys)
+    assert tp.text == "First sentence? Second sentence. Third sentence."
+
+
 def test_parse_text_remove_keys():
     tp = parse_text(test_text_sentences, remove_keys=["sentence", "!"])
     assert tp.text == "First. Second. Third."
@@ -335,6 +361,21 @@ def test_parse_text_remove_keys_raw_text():
     assert pt.sentences == ["Easybook pro 15 Gray."]
 
 
+def test_parse_text_html_fragments():
+    test_html = (
+        "<ul><li>Caf&eacute; uÌˆnicode</li><li>Add to cart</li>"
+        "<li>Add to cart</li><li>Color:. Black</li></ul>"
+    )
+
+    pt = parse_text(test_html, replace_keys_raw_text=[("cart", "bag")])
+    assert pt.sentences == [
+        "Café ünicode.",
+        "Add to bag.",
+        "Add to bag.",
+        "Color: Black.",
+    ]
+
+
 def test_parse_text_html_table():
     tp = parse_text(table_samples.table_without_header_v3)
     expected_results = ["Type: Easybook Pro.", "Operating system: etOS."]
@@ -409,3 +450,11 @@ def test_parse_text_radd():
 
     tp = ["hello", "World!"] + parse_text(test_text)
     assert str(tp) == "Hello. World! First feature. Second feature?"
+
+
+def test_parse_text_workers(monkeypatch):
+    monkeypatch.setattr(sentences, "PARALLEL_MIN_CHUNK_CHARS", 16)
+
+    test_text = " ".join([test_text_sentences_v3] * 20)
+    expected_sentences = parse_text(test_text).sentences
+    assert parse_text(test_text, workers=2).sentences == expected_sentences
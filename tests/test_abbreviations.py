@@ -0,0 +1,109 @@
+import pytest
+
+from easytxt import abbreviations, sentences
+
+
+@pytest.mark.parametrize(
+    "language, test_data, result",
+    [
+        ("en", "Written by Dr. ", True),
+        ("en", "Written by dr.", True),
+        ("en", "Written by DR.  ", True),
+        ("en", "Written by Ph.D. ", True),
+        ("en", "Cable (incl. ", True),
+        ("en", "Cable,incl. ", True),
+        ("en", "Etc. ", False),
+        ("en", "Written by Mrſ. ", True),
+        ("en", "Option ı. ", True),
+        ("en", "Option İ. ", True),
+        ("en", "The summr. ", True),
+        ("en", "Written by Adams. ", False),
+        ("en", "Written by Dr ", False),
+        ("en", "Written by Dr! ", False),
+        ("en", "Written by XDr. ", False),
+        ("es", "La Sr(a). ", True),
+        ("es", "La Exmo(a). ", False),
+        ("es", "Send to ilmoa. ", True),
+        ("es", "La (a). ", False),
+        ("es", "Ver v. em. ", True),
+        ("es", "Del profesor(as). ", True),
+        ("es", "Del (profesor(as). ", True),
+        ("es", "Del .profesor(as). ", False),
+        ("es", "Del profesor (as). ", False),
+    ],
+)
+def test_endswith_abbreviation(language, test_data, result):
+    matcher = abbreviations.get_matcher(language)
+    assert matcher.endswith_abbreviation(test_data) is result
+
+
+@pytest.mark.parametrize(
+    "language, test_data, result",
+    [
+        (
+            "en",
+            "Hello John. Incl. VAT and shipping.",
+            ["Hello John.", "Incl.", "VAT and shipping."],
+        ),
+        ("en", "The summr. Next one here.", ["The summr. Next one here."]),
+        ("en", "Written by Mrſ. Adams here.", ["Written by Mrſ. Adams here."]),
+        ("es", "Send to ilmoa. Next one here.", ["Send to ilmoa. Next one here."]),
+        ("es", "La Exmo(a). Nueva frase.", ["La Exmo(a).", "Nueva frase."]),
+    ],
+)
+def test_sentences_with_abbreviations(language, test_data, result):
+    assert sentences.from_text(test_data, language=language) == result
+
+
+@pytest.mark.parametrize(
+    "test_data, result",
+    [
+        ("Some quiz. ", True),
+        ("Some q uiz. ", True),
+        ("In 5 weeks. ", True),
+        ("In 5 weeks x. ", False),
+        ("In 5 weeks. x. ", False),
+    ],
+)
+def test_endswith_unbounded_abbreviation(test_data, result):
+    # "q[a-z ]+z" can match whitespace, "[a-z]+ks" only within a word
+    matcher = abbreviations.AbbreviationMatcher(["Approx", r"q[a-z ]+z", r"[a-z]+ks"])
+    assert matcher.endswith_abbreviation(test_data) is result
+
+
+def test_endswith_abbreviation_offsets():
+    matcher = abbreviations.AbbreviationMatcher(["Dr"])
+    test_text = "Hello Dr. Adams. "
+
+    assert matcher.endswith_abbreviation(test_text, 0, 10) is True
+    assert matcher.endswith_abbreviation(test_text, 8, 10) is False
+    assert matcher.endswith_abbreviation(test_text, 6, 10) is True
+    assert matcher.endswith_abbreviation(test_text) is False
+
+
+def test_get_abbreviations_from_language_pack():
+    en_abbreviations = abbreviations.get_abbreviations("en")
+    assert "Ph.D" in en_abbreviations
+    assert abbreviations.en == en_abbreviations
+
+
+def test_get_abbreviations_unknown_language():
+    with pytest.raises(ValueError):
+        abbreviations.get_abbreviations("xx-unknown")
+
+    with pytest.raises(ValueError):
+        abbreviations.get_matcher("../en")
+
+
+def test_register_language():
+    abbreviations.register_language("xx-test", ["Approx"])
+    matcher = abbreviations.get_matcher("xx-test")
+
+    assert matcher.endswith_abbreviation("It is approx. ")
+    assert not matcher.endswith_abbreviation("It is Dr. ")
+
+    abbreviations.register_language("xx-test", ["Dr"])
+    matcher = abbreviations.get_matcher("xx-test")
+
+    assert not matcher.endswith_abbreviation("It is approx. ")
+    assert matcher.endswith_abbreviation("It is Dr. ")
@@ -0,0 +1,55 @@
+import pytest
+from cssselect import SelectorError
+from pyquery import PyQuery
+
+from easytxt import css
+
+HTML_TEXT = (
+    '<div><p class="x">First <b>one</b></p><p>Second</p>'
+    "<table><tr><th>Key</th><td>Value</td></tr></table></div>"
+)
+
+
+@pytest.mark.parametrize(
+    "selector",
+    ["p", ".x", "p.x b", "td,th", "th ~ td", "p:first", "p:contains('Second')", ""],
+)
+def test_select(selector):
+    pq = PyQuery(HTML_TEXT)
+
+    assert css.select(pq, selector) == list(pq(selector))
+    assert css.select(list(pq), selector) == list(pq(selector))
+
+
+def test_select_namespaces():
+    pq = PyQuery(
+        '<root xmlns="http://example.com/ns"><item>Value</item></root>',
+        parser="xml",
+        namespaces={"ns": "http://example.com/ns"},
+    )
+
+    assert css.select(pq, "ns|item") == list(pq("ns|item"))
+    assert len(css.select(pq, "ns|item")) == 1
+
+
+def test_selector_cache():
+    css.clear_selector_cache()
+
+    css.preload_selectors(["p", ".x"])
+
+    assert css.selector_cache_info()[:3] == (0, 2, 2)
+
+    css.select(PyQuery(HTML_TEXT), "p")
+    css.select(PyQuery(HTML_TEXT), "td")
+
+    assert css.selector_cache_info()[:3] == (1, 3, 3)
+    assert css.compile_selector("p") is css.compile_selector("p")
+
+    css.clear_selector_cache()
+
+    assert css.selector_cache_info()[:3] == (0, 0, 0)
+
+
+def test_preload_selectors_invalid():
+    with pytest.raises(SelectorError):
+        css.preload_selectors(["p", "p["])
@@ -1,8 +1,26 @@
-from easytxt import html
+from pyquery import PyQuery
+
+from easytxt import config, html
 
 
 def test_to_text():
-    test_html_texts = [("<p>Some sentence</p>", ["Some sentence"])]
+    test_html_texts = [
+        ("<p>Some sentence</p>", ["Some sentence"]),
+        (
+            "<div><p>First <b>bold</b> sentence</p><p>Second<br>line</p></div>",
+            ["First bold sentence", "Second ", " line"],
+        ),
+        (
+            "<div>Intro <!-- note --> text<div><span>Nested</span> block</div></div>",
+            ["Intro", "text", "Nested block"],
+        ),
+        (
+            "<div><p>Size</p><table><tr><td>Color</td><td>Black</td></tr></table></div>",
+            ["Size", "Color: Black"],
+        ),
+        ("<div><p> \u200b </p><p>Visible</p><p>x</p></div>", ["Visible"]),
+        ("<div><textarea>  </textarea><p>Text</p></div>", ["Text"]),
+    ]
 
     for text_html_tuple in test_html_texts:
         html_text, expected_text = text_html_tuple
@@ -10,6 +28,26 @@ def test_to_text():
         assert html.to_sentences(html_text) == expected_text
 
 
+def test_to_text_css_query():
+    html_text = "<div><p>A one</p><p>B two</p><span>Skip</span></div>"
+
+    assert html.to_sentences(html_text, css_query="p") == ["A one B two"]
+
+
+def test_to_text_exclude_css():
+    pq = PyQuery(
+        '<div><p>Keep <span class="ad">Ad</span> this</p><script>x()</script>'
+        '<p class="ad">Ad text</p><table><tr><td>Color</td>'
+        '<td>Black <i class="ad">Ad</i></td></tr></table></div>'
+    )
+    html_text = pq.outer_html()
+
+    assert html.to_sentences(pq, exclude_css=".ad") == ["Keep  this", "Color: Black"]
+    # parsed html is left as it was, so it can be used again
+    assert pq.outer_html() == html_text
+    assert html.to_sentences(pq) == ["Keep Ad this", "Ad text", "Color: Black Ad"]
+
+
 def test_validate():
     test_valid_html_texts = [
         "<p>Some sentence</p>",
@@ -23,6 +61,24 @@ def test_validate():
 
 
 def test_validate_invalid():
-    test_invalid_html_texts = ["Some sentence"]
+    test_invalid_html_texts = [
+        "Some sentence",
+        "if a < b and c > d",
+        "for (i = 0; i<n; i++) { x = y / z; }",
+        "<p>Split over\nlines</p>",
+        "<!-- comment -->",
+    ]
     for test_invalid_html_text in test_invalid_html_texts:
         assert html.validate(test_invalid_html_text) is False
+
+
+def test_validate_max_chars(monkeypatch):
+    text = "Some sentence " * 10 + "<p>Some sentence</p>"
+
+    assert html.validate(text)
+    assert html.validate(text, max_chars=100) is False
+
+    monkeypatch.setattr(config, "HTML_VALIDATE_MAX_CHARS", 100)
+
+    assert html.validate(text) is False
+    assert html.validate(text, max_chars=1000)
@@ -1,4 +1,8 @@
-from easytxt import sentences
+import io
+
+import pytest
+
+from easytxt import abbreviations, sentences
 from tests.factory import raw_sentences_samples
 
 
@@ -49,6 +53,16 @@ def test_remove_chars_by_keys() -> None:
     assert final_sentences == ["Hello.", "How are you?", "okay!"]
 
 
+def test_replace_chars_by_keys_normalized() -> None:
+    test_sentences = ["Hello  John.", "How are you?"]
+    replace_keys = [("how", "Where")]
+    final_sentences = sentences.replace_chars_by_keys(
+        test_sentences, replace_keys=replace_keys, normalized=True
+    )
+    # Only changed sentences get normalized again
+    assert final_sentences == ["Hello  John.", "Where are you?"]
+
+
 def test_remove_empty() -> None:
     test_sentences = ["Hello John.", ".", "Am", "", None, "How are you?"]
     final_sentences = sentences.remove_empty(test_sentences)
@@ -104,3 +118,168 @@ def test_split_inline_breaks_to_sentences() -> None:
     test_text = ["* notebook * ultrabook"]
     result = sentences.split_inline_breaks_to_sentences(test_text)
     assert result == ["notebook", "ultrabook"]
+
+
+def test_get_segmenter_is_reused() -> None:
+    segmenter = sentences.get_segmenter("en", stop_keys=["."], inline_breaks=["#"])
+    hits = sentences.segmenter_cache_info().hits
+
+    assert sentences.get_segmenter("en", ["."], ["#"]) is segmenter
+    assert sentences.segmenter_cache_info().hits == hits + 1
+    assert sentences.get_segmenter("es", ["."], ["#"]) is not segmenter
+
+
+def test_from_text_custom_inline_breaks() -> None:
+    inline_breaks = ["#"]
+    result = sentences.from_text("camera # notebook", inline_breaks=inline_breaks)
+    assert result == ["camera", "notebook"]
+    assert inline_breaks == ["#"]
+
+
+def test_from_text_registered_language() -> None:
+    abbreviations.register_language("xx-sentences", ["Approx"])
+    test_text = "Approx. 5 pcs. in a box. Qty. 10!"
+    result = sentences.from_text(test_text, language="xx-sentences")
+    assert result == ["Approx. 5 pcs.", "in a box.", "Qty.", "10!"]
+
+
+def test_from_text_spans() -> None:
+    test_text = "Mr. John  is here. * Say hello!!!"
+    sentence_spans = sentences.from_text(test_text, spans=True)
+
+    assert sentence_spans == ["Mr. John is here.", "Say hello!!!"]
+    assert list(sentence_spans.spans()) == [(0, 17), (20, 32)]
+    assert sentence_spans.span(-1) == (20, 32)
+    assert sentence_spans.text[20:32] == sentence_spans[1]
+    assert sentence_spans[:1] == ["Mr. John is here."]
+
+
+@pytest.mark.parametrize("split_inline_breaks", [True, False])
+def test_from_text_spans_same_as_sentences(split_inline_breaks) -> None:
+    for paragraph, _ in raw_sentences_samples.english:
+        assert list(
+            sentences.from_text(
+                paragraph, spans=True, split_inline_breaks=split_inline_breaks
+            )
+        ) == sentences.from_text(paragraph, split_inline_breaks=split_inline_breaks)
+
+
+def test_from_texts() -> None:
+    test_texts = ["Mr. John  is here. * Say hello!!!", "", "Bye"]
+    flat_sentences, offsets = sentences.from_texts(iter(test_texts))
+
+    assert flat_sentences == ["Mr. John is here.", "Say hello!!!", "Bye"]
+    assert list(offsets) == [0, 2, 2, 3]
+
+
+def test_from_texts_normalized() -> None:
+    flat_sentences, offsets = sentences.from_texts(
+        ["Mr. John is here. Say hello!!!", "Bye"], normalized=True
+    )
+
+    assert flat_sentences == ["Mr. John is here.", "Say hello!!!", "Bye"]
+    assert list(offsets) == [0, 2, 3]
+
+
+@pytest.mark.parametrize("split_inline_breaks", [True, False])
+def test_from_texts_same_as_from_text(split_inline_breaks) -> None:
+    paragraphs = [paragraph for paragraph, _ in raw_sentences_samples.english]
+    flat_sentences, offsets = sentences.from_texts(
+        paragraphs, split_inline_breaks=split_inline_breaks
+    )
+
+    for i, paragraph in enumerate(paragraphs):
+        assert flat_sentences[offsets[i] : offsets[i + 1]] == sentences.from_text(
+            paragraph, split_inline_breaks=split_inline_breaks
+        )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_iter_from_text_file(chunk_size) -> None:
+    for paragraph, test_sentences in raw_sentences_samples.english:
+        text_file = io.StringIO(paragraph)
+        result = sentences.iter_from_text(text_file, chunk_size=chunk_size)
+        assert list(result) == test_sentences
+
+
+def test_iter_from_text_chunks() -> None:
+    text_chunks = ["Mr", ". John  ", " is here", " .  Say hello", "!!! ", " Bye"]
+    result = sentences.iter_from_text(text_chunks)
+    assert list(result) == ["Mr. John is here.", "Say hello!!!", "Bye"]
+
+
+@pytest.mark.parametrize(
+    "language, test_text",
+    [
+        ("en", "GET /index.html 200 user=abc\n" * 200),
+        ("en", "Written by Dr. Adams, Ph.D. in No. 5 street. " * 50),
+        ("es", "La Sra. del profesor(as). Sr(a). Adams vino hoy. " * 50),
+    ],
+)
+def test_iter_from_text_small_chunks(language, test_text) -> None:
+    text_file = io.StringIO(test_text)
+    result = sentences.iter_from_text(text_file, language=language, chunk_size=7)
+    assert list(result) == sentences.from_text(test_text, language=language)
+
+
+def test_merge_last_sentence() -> None:
+    test_sentences = ["Some paragraph!", "Color:", "Material:"]
+    merged_sentences = ["Some paragraph!", "Color: Material:"]
+    assert sentences.merge(test_sentences) == merged_sentences
+    assert test_sentences == ["Some paragraph!", "Color:", "Material:"]
+
+    assert sentences.merge(["Some paragraph!", "Color:"]) == test_sentences[:2]
+
+
+def test_iter_merge() -> None:
+    test_sentences = iter(["Color|", "Black.", "Some paragraph!"])
+    merged_sentences = sentences.iter_merge(test_sentences, "|")
+    assert next(merged_sentences) == "Color| Black."
+    assert list(merged_sentences) == ["Some paragraph!"]
+
+
+def test_split_inline_breaks_to_sentences_custom_breaks() -> None:
+    inline_breaks = ["#"]
+    test_text = ["notebook # ultrabook * tablet", "  "]
+    result = sentences.split_inline_breaks_to_sentences(test_text, inline_breaks)
+    assert result == ["notebook", "ultrabook", "tablet"]
+    assert inline_breaks == ["#"]
+
+
+def test_from_text_workers(monkeypatch) -> None:
+    monkeypatch.setattr(sentences, "PARALLEL_MIN_CHUNK_CHARS", 64)
+
+    test_text = " ".join(
+        "Sentence number {} is written by Dr. Adams, Ph.D. in No. {}!".format(i, i)
+        for i in range(50)
+    )
+
+    assert sentences.from_text(test_text, workers=3) == sentences.from_text(test_text)
+
+
+@pytest.mark.parametrize("language", ["en", "es"])
+def test_split_to_independent_chunks(monkeypatch, language) -> None:
+    monkeypatch.setattr(sentences, "PARALLEL_MIN_CHUNK_CHARS", 64)
+
+    test_text = " ".join(
+        "Frase {} del profesor(as). Sr. Adams, Ph.D. en No. {}!".format(i, i)
+        for i in range(50)
+    )
+    segmenter = sentences.get_segmenter(language=language)
+
+    text_chunks = segmenter._split_to_independent_chunks(
+        text=test_text,
+        abbreviation_matcher=abbreviations.get_matcher(language),
+        max_chunks=3,
+    )
+
+    assert len(text_chunks) > 1
+    assert "".join(text_chunks) == test_text
+    assert sentences.from_text(
+        test_text, language=language, workers=3
+    ) == sentences.from_text(test_text, language=language)
+
+
+def test_from_text_spans_workers() -> None:
+    with pytest.raises(ValueError):
+        sentences.from_text("First sentence. Second one.", spans=True, workers=2)
@@ -1,6 +1,8 @@
 import pytest
+from number_parser import parse
+from number_parser.parser import SUPPORTED_LANGUAGES
 
-from easytxt import text
+from easytxt import config, text
 
 
 def test_capitalize() -> None:
@@ -18,6 +20,9 @@ def test_capitalize_paragraph():
     "test_data, rkey, rvalue, result",
     [
         ("It's a world.", "world", "city", "It's a city."),
+        ("It's a World.", "world", "city", "It's a city."),
+        ("It's a world.", "town", "city", "It's a world."),
+        ("It's a world.", r"w\w+d", "city", "It's a city."),
     ],
 )
 def test_replace_chars_by_key(test_data, rkey, rvalue, result):
@@ -32,11 +37,45 @@ def test_replace_chars_by_key(test_data, rkey, rvalue, result):
             [("beautiful", "fine"), ("world", "town")],
             "It's a fine town.",
         ),
+        # Keys are replaced in order, later keys see earlier replacements
+        ("Black metal", [("black", "dark"), ("dark metal", "steel")], "steel"),
+        ("Black metal", [("dark metal", "steel"), ("black", "dark")], "dark metal"),
+        ("Black metal", [("ack m", "-"), ("black", "white")], "Bl-etal"),
+        ("Black metal", [("bl", ""), ("ack", "ue")], "ue metal"),
+        ("12 inch", [(r"(\d+) inch", r'\1"'), ('"', " in")], "12 in"),
+        # Single chars are translated, also escaped regex special chars
+        ("A*b|c®", [("a", "x"), (r"\*", ""), (r"\|", "-"), ("®", "")], "xb-c"),
+        ("abc", [("a", "b"), ("b", "c")], "ccc"),
+        ("a-b c", [("-", " "), ("a b", "ab")], "ab c"),
     ],
 )
 def test_replace_chars_by_keys(test_data, replace_keys, result):
     assert text.replace_chars_by_keys(test_data, replace_keys) == result
 
+    replacement_table = text.ReplacementTable(replace_keys)
+    assert replacement_table.replace(test_data) == result
+    assert text.replace_chars_by_keys(test_data, replacement_table) == result
+
+
+@pytest.mark.parametrize(
+    "test_data, remove_keys, result",
+    [
+        ("Easybook® Pro™ | 15*", ["®", "™", r"\|", r"\*"], "Easybook Pro  15"),
+        ("Easybook Pro 15", ["pro", "e"], "asybook  15"),
+    ],
+)
+def test_remove_chars_by_keys(test_data, remove_keys, result):
+    assert text.remove_chars_by_keys(test_data, remove_keys) == result
+
+
+def test_get_replacement_table() -> None:
+    replace_keys = [("pro", "Air"), ("15", "13")]
+    replacement_table = text.get_replacement_table(replace_keys)
+
+    assert text.get_replacement_table(list(replace_keys)) is replacement_table
+    assert text.get_replacement_table(replacement_table) is replacement_table
+    assert len(replacement_table) == 2
+
 
 @pytest.mark.parametrize(
     "test_data, result",
@@ -125,6 +164,24 @@ def test_contains_case(test_data, keys, case_sensitive, result) -> None:
     assert text.contains(test_data, keys, case_sensitive) == result
 
 
+@pytest.mark.parametrize(
+    "test_data, keys, case_sensitive, result",
+    [
+        ("Hello World!", ["city", "WORLD"], False, True),
+        ("Hello World!", ["city", "WORLD"], True, False),
+        ("Hello World!", ["worlds", "hell"], False, True),
+        ("Hello World!", ["ello w"], True, False),
+        ("Hello World!", ["city", r"w\w+d"], False, True),
+        ("Hello Wörld!", ["WÖRLD"], False, True),
+        ("Hello Wörld!", ["WÖRLD"], True, False),
+    ],
+)
+def test_keyword_set(test_data, keys, case_sensitive, result) -> None:
+    keyword_set = text.KeywordSet(keys, case_sensitive)
+    assert keyword_set.contains(test_data) is result
+    assert text.contains(test_data, keyword_set) is result
+
+
 @pytest.mark.parametrize(
     "test_data, result",
     [
@@ -136,6 +193,20 @@ def test_normalize_spaces(test_data, result) -> None:
     assert text.normalize(test_data) == result
 
 
+def test_normalize_spaces_audit_normalized(monkeypatch) -> None:
+    assert text.normalize_spaces("Some text  is here", normalized=True) == (
+        "Some text  is here"
+    )
+
+    monkeypatch.setattr(config, "AUDIT_NORMALIZATION", True)
+    assert text.normalize_spaces("Some text is here", normalized=True) == (
+        "Some text is here"
+    )
+
+    with pytest.raises(AssertionError):
+        text.normalize_spaces("Some text  is here", normalized=True)
+
+
 @pytest.mark.parametrize(
     "test_data, result",
     [
@@ -167,6 +238,88 @@ def test_normalize(test_data, result) -> None:
     assert text.normalize(test_data) == result
 
 
+@pytest.mark.parametrize(
+    "test_data, result",
+    [
+        ("Plain ascii text\n", "Plain ascii text\n"),
+        ("Fish &amp; chips", "Fish & chips"),
+        ("Line\r\nbreak", "Line\nbreak"),
+        ("uÌˆnicode", "ünicode"),
+    ],
+)
+def test_fix_text(test_data, result) -> None:
+    assert text.fix_text(test_data) == result
+
+
+def test_fix_text_cache() -> None:
+    assert text.fix_text_cache_info() is None
+
+    text.enable_fix_text_cache(maxsize=2)
+
+    try:
+        assert text.fix_text("uÌˆnicode") == "ünicode"
+        assert text.fix_text("uÌˆnicode") == "ünicode"
+        assert text.fix_text("Plain ascii text") == "Plain ascii text"
+
+        cache_info = text.fix_text_cache_info()
+        assert (cache_info.hits, cache_info.misses, cache_info.maxsize) == (1, 1, 2)
+    finally:
+        text.disable_fix_text_cache()
+
+    assert text.fix_text_cache_info() is None
+
+
+def test_fix_texts() -> None:
+    test_texts = ["uÌˆnicode", "Plain ascii text", "Fish &amp; chips", "uÌˆnicode"]
+
+    assert text.fix_texts(test_texts) == [text.fix_text(t) for t in test_texts]
+
+
+def test_normalize_texts() -> None:
+    test_texts = ["Fish &amp;  chips ", "Color:.", 12, "Fish &amp;  chips "]
+
+    assert text.normalize_texts(test_texts) == [text.normalize(t) for t in test_texts]
+
+
+@pytest.mark.parametrize(
+    "test_data, result",
+    [
+        ("Box of twenty four items", "Box of 24 items"),
+        ("The first  item ", "The 1  item"),
+        (" Box with\xad lid ", "Box with lid"),
+        ("Box with lid", "Box with lid"),
+    ],
+)
+def test_to_numeric_from_text_num(test_data, result) -> None:
+    assert text.to_numeric_from_text_num(test_data) == result
+    assert text.to_numeric_from_text_num(test_data) == parse(test_data, language="en")
+
+
+def test_to_numeric_from_text_nums() -> None:
+    test_texts = ["one box", "no boxes", "one box"]
+
+    assert text.to_numeric_from_text_nums(test_texts) == ["1 box", "no boxes", "1 box"]
+
+
+@pytest.mark.parametrize("language", SUPPORTED_LANGUAGES)
+def test_text_num_words_match_number_parser(language) -> None:
+    # Words skipped by the prefilter must be left unchanged by number_parser
+    text_num_words = list(text._get_text_num_words(language))
+    test_words = text_num_words + ["first", "twelfth", "twentieth", "box", "and"]
+    test_words += [word + "th" for word in text_num_words]
+
+    for word in test_words:
+        if not text._is_text_num_word(word, language):
+            assert parse(word, language=language) == word
+
+    assert all(text._is_text_num_word(word, language) for word in text_num_words)
+
+
+def test_to_numeric_from_text_num_unsupported_language() -> None:
+    with pytest.raises(ValueError):
+        text.to_numeric_from_text_num("", language="xx")
+
+
 @pytest.mark.parametrize(
     "test_data, result",
     [
@@ -179,6 +332,21 @@ def test_to_string(test_data, result) -> None:
     assert text.to_str(test_data) == result
 
 
+@pytest.mark.parametrize(
+    "test_data, split_key, split_index, case_sensitive, result",
+    [
+        ("Black - weight: 2 kg", "weight", 0, False, "Black - "),
+        ("Black - weight: 2 kg", r"\s-\s", 1, False, "weight: 2 kg"),
+        ("a; b; c; d", "; ", -1, False, "c; d"),
+        ("a; b; c; d", "; ", -1, True, "d"),
+    ],
+)
+def test_split_by_key(test_data, split_key, split_index, case_sensitive, result):
+    assert (
+        text.split_by_key(test_data, split_key, split_index, case_sensitive) == result
+    )
+
+
 @pytest.mark.parametrize(
     "test_data, split_key, result",
     [